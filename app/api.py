@@ -5,21 +5,41 @@
 и использует зависимости для аутентификации пользователя.
 """
 
+import base64
+import binascii
+import csv
+from dataclasses import asdict
+import io
+import json
 from datetime import datetime
+from typing import AsyncIterator, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Cookie
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Cookie, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db
+from app.dependencies import get_db, resolve_session_user
 from . import crud, schemas, models
+from .http_cache import cache_headers, is_not_modified, make_etag, not_modified_response, query_digest
+from .importer import import_tasks
+from .auth import password_hasher
+from .configs.configs import EXPORT_BATCH_SIZE, SEARCH_LIMIT, TASK_BATCH_LIMIT
+from .database import AsyncSessionLocal, pool_stats
 
-# Создание объекта APIRouter
-api_router = APIRouter()
+# Создание объекта APIRouter. Ответы сериализуются библиотекой orjson
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
+# Поля задачи в ответах API в порядке полей schemas.Task
+TASK_FIELDS: tuple[str, ...] = tuple(schemas.Task.model_fields)
 
-def get_current_user(
+# Столбцы файла экспорта задач
+EXPORT_FIELDS: list[str] = ["id", "title", "description", "status", "priority", "deadline", "owner_id"]
+
+
+async def get_current_user(
     session_token: str | None = Cookie(None),  # Токен сессии из cookie
-    db: Session = Depends(get_db)  # Сессия базы данных
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
 ) -> models.User:
     """
     Получает текущего пользователя на основе токена сессии.
@@ -28,7 +48,7 @@ def get_current_user(
 
     Args:
         session_token (str | None): Токен сессии, переданный через cookie. По умолчанию None.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
         models.User: Объект пользователя, если сессия действительна.
@@ -39,37 +59,313 @@ def get_current_user(
     if session_token is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
-    session: models.Session | None = crud.get_session(db, session_token)
-    if session is None or session.expires_at < datetime.utcnow():
+    user: models.User | None = await resolve_session_user(db, session_token)
+    if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session expired")
 
-    return session.user
+    return user
+
+
+def _task_payload(task: models.Task) -> dict:
+    """
+    Преобразует объект задачи в словарь для ответа API без проверки моделью `schemas.Task`.
+
+    Используется для списков задач, загруженных из базы данных: их данные уже прошли проверку
+    при записи, поэтому повторная проверка Pydantic только тратит время. orjson сериализует
+    словарь (включая `datetime`) сразу в байты, и результат совпадает с сериализацией `schemas.Task`.
+
+    Args:
+        task (models.Task): Объект задачи.
+
+    Returns:
+        dict: Поля задачи в порядке полей `schemas.Task`.
+    """
+    return {name: getattr(task, name) for name in TASK_FIELDS}
+
+
+def _encode_cursor(last_id: int) -> str:
+    """
+    Кодирует позицию страницы в непрозрачный токен.
+
+    Args:
+        last_id (int): Идентификатор последней задачи страницы.
+
+    Returns:
+        str: Токен следующей страницы.
+    """
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode()
 
 
-@api_router.get("/tasks", response_model=list[schemas.Task])
+def _decode_cursor(cursor: str) -> int:
+    """
+    Декодирует токен страницы, полученный от `_encode_cursor`.
+
+    Args:
+        cursor (str): Токен страницы.
+
+    Returns:
+        int: Идентификатор задачи, после которой начинается страница.
+
+    Raises:
+        HTTPException: Если токен поврежден.
+    """
+    try:
+        last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return last_id
+
+
+@api_router.get("/tasks", response_model=schemas.TaskPage)
 async def get_tasks(
+    request: Request,  # Объект запроса
+    limit: int = Query(100, ge=1, le=500),  # Размер страницы
+    cursor: str | None = Query(None),  # Токен страницы из поля next_cursor предыдущего ответа
+    task_status: Literal[models.TASK_STATUSES] | None = Query(None, alias="status"),  # Фильтр по статусу
+    priority: Literal[models.TASK_PRIORITIES] | None = Query(None),  # Фильтр по приоритету
+    deadline_from: datetime | None = Query(None),  # Нижняя граница срока выполнения
+    deadline_to: datetime | None = Query(None),  # Верхняя граница срока выполнения
+    current_user: models.User = Depends(get_current_user),  # Текущий пользователь
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
+) -> ORJSONResponse:
+    """
+    Получает страницу задач текущего пользователя.
+
+    Используется курсорная пагинация: чтобы получить следующую страницу, передайте `next_cursor`
+    из ответа в параметре `cursor`. Если `next_cursor` равен null, страница последняя.
+
+    Фильтры по статусу, приоритету и диапазону сроков применяются в запросе к базе данных,
+    поэтому страница всегда содержит до `limit` подходящих задач. При переходе по страницам
+    фильтры нужно передавать вместе с `cursor`.
+
+    Ответ содержит ETag версии списка задач пользователя с учетом страницы и фильтров и Last-Modified
+    версии списка. Если задачи не менялись с момента, указанного в If-None-Match или If-Modified-Since,
+    возвращается 304 без загрузки задач.
+
+    Args:
+        request (Request): Объект запроса.
+        limit (int): Максимальное количество задач на странице. По умолчанию 100.
+        cursor (str | None): Токен страницы. По умолчанию None (первая страница).
+        task_status (str | None): Фильтр по статусу (параметр `status`). По умолчанию None.
+        priority (str | None): Фильтр по приоритету. По умолчанию None.
+        deadline_from (datetime | None): Нижняя граница срока выполнения (включительно). По умолчанию None.
+        deadline_to (datetime | None): Верхняя граница срока выполнения (включительно). По умолчанию None.
+        current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
+
+    Returns:
+        ORJSONResponse: Задачи страницы и токен следующей страницы (см. `schemas.TaskPage`)
+        или пустой ответ 304, если список задач не изменился.
+
+    Raises:
+        HTTPException: Если токен страницы поврежден.
+    """
+    after_id: int | None = _decode_cursor(cursor) if cursor else None
+    version, updated_at = await crud.get_tasks_version(db, current_user.id)
+    # ETag зависит от страницы и фильтров, чтобы 304 не подменял одну страницу другой
+    etag: str = make_etag(
+        "tasks",
+        current_user.id,
+        version,
+        query_digest(
+            after_id,
+            limit,
+            task_status,
+            priority,
+            deadline_from.isoformat() if deadline_from else None,
+            deadline_to.isoformat() if deadline_to else None
+        )
+    )
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at)
+
+    tasks: list[models.Task] = await crud.get_tasks(
+        db,
+        user_id=current_user.id,
+        limit=limit + 1,
+        after_id=after_id,
+        status=task_status,
+        priority=priority,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to
+    )
+
+    next_cursor: str | None = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = _encode_cursor(tasks[-1].id)
+    # Ответ возвращается напрямую, минуя проверку response_model
+    return ORJSONResponse(
+        {"items": [_task_payload(task) for task in tasks], "next_cursor": next_cursor},
+        headers=cache_headers(etag, updated_at)
+    )
+
+
+@api_router.get("/tasks/changes", response_model=schemas.TaskChanges)
+async def get_task_changes(
+    since: int = Query(0, ge=0),  # Последняя известная клиенту версия списка задач
+    current_user: models.User = Depends(get_current_user),  # Текущий пользователь
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
+) -> ORJSONResponse:
+    """
+    Возвращает изменения задач текущего пользователя после версии списка `since`.
+
+    Каждое изменение задач увеличивает версию списка пользователя; измененные задачи
+    и записи об удаленных задачах помечаются этой версией. Поэтому объем ответа зависит
+    от количества изменений, а не от общего количества задач. При `since` = 0 возвращаются все задачи.
+
+    Args:
+        since (int): Значение `version` из предыдущего ответа. По умолчанию 0 (полная синхронизация).
+        current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
+
+    Returns:
+        ORJSONResponse: Текущая версия, измененные задачи и идентификаторы удаленных задач (см. `schemas.TaskChanges`).
+
+    Raises:
+        HTTPException: Если `since` больше текущей версии списка задач.
+    """
+    version, tasks, deleted_ids = await crud.get_task_changes(db, current_user.id, since)
+    if since > version:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unknown version, resync with since=0")
+
+    return ORJSONResponse({
+        "version": version,
+        "upserts": [_task_payload(task) for task in tasks],
+        "deletes": deleted_ids
+    })
+
+
+async def _export_ndjson(user_id: int) -> AsyncIterator[bytes]:
+    """
+    Формирует экспорт задач пользователя в формате NDJSON (одна задача в строке).
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+
+    Yields:
+        bytes: Строки пачки задач.
+    """
+    # Сессия зависимости get_db закрывается до отправки тела ответа, поэтому поток открывает собственную
+    async with AsyncSessionLocal() as db:
+        async for rows in crud.stream_tasks(db, user_id, EXPORT_BATCH_SIZE):
+            yield b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+async def _export_csv(user_id: int) -> AsyncIterator[str]:
+    """
+    Формирует экспорт задач пользователя в формате CSV с заголовком.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+
+    Yields:
+        str: Строки пачки задач.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async with AsyncSessionLocal() as db:
+        async for rows in crud.stream_tasks(db, user_id, EXPORT_BATCH_SIZE):
+            buffer.seek(0)
+            buffer.truncate()
+            for row in rows:
+                if row["deadline"] is not None:
+                    row["deadline"] = row["deadline"].isoformat()
+                writer.writerow(row)
+            yield buffer.getvalue()
+
+
+@api_router.get("/tasks/export")
+async def export_tasks(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),  # Формат файла экспорта
+    current_user: models.User = Depends(get_current_user)  # Текущий пользователь
+) -> StreamingResponse:
+    """
+    Экспортирует все задачи текущего пользователя в формате NDJSON или CSV.
+
+    Задачи читаются из серверного курсора пачками по `EXPORT_BATCH_SIZE` и сразу отправляются клиенту,
+    поэтому память не зависит от количества задач.
+
+    Args:
+        format (str): Формат файла: "ndjson" или "csv". По умолчанию "ndjson".
+        current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
+
+    Returns:
+        StreamingResponse: Потоковый ответ с файлом экспорта.
+    """
+    if format == "csv":
+        content, media_type = _export_csv(current_user.id), "text/csv; charset=utf-8"
+    else:
+        content, media_type = _export_ndjson(current_user.id), "application/x-ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'}
+    )
+
+
+@api_router.post("/tasks/import", response_model=schemas.TaskImportResult)
+async def import_tasks_file(
+    request: Request,  # Объект запроса, тело которого содержит файл импорта
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),  # Формат файла импорта
     current_user: models.User = Depends(get_current_user),  # Текущий пользователь
-    db: Session = Depends(get_db)  # Сессия базы данных
-) -> list[schemas.Task]:
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
+) -> schemas.TaskImportResult:
     """
-    Получает список задач текущего пользователя.
+    Импортирует задачи текущего пользователя из файла CSV или NDJSON, переданного в теле запроса.
+
+    Тело запроса читается потоком и загружается пачками по `IMPORT_CHUNK_SIZE` строк.
+    Ошибочные строки пропускаются и перечисляются в ответе.
 
     Args:
+        request (Request): Объект запроса.
+        format (str): Формат файла: "ndjson" или "csv". По умолчанию "ndjson".
         current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
-        list[schemas.Task]: Список задач текущего пользователя.
+        schemas.TaskImportResult: Количество загруженных задач и ошибки строк.
+    """
+    report = await import_tasks(db, current_user.id, request.stream(), format)
+    return asdict(report)
+
+
+@api_router.get("/tasks/search", response_model=list[schemas.Task])
+async def search_tasks(
+    query: str = Query(..., min_length=1),  # Поисковый запрос
+    limit: int = Query(SEARCH_LIMIT, ge=1, le=SEARCH_LIMIT),  # Максимальное количество результатов
+    current_user: models.User = Depends(get_current_user),  # Текущий пользователь
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
+) -> ORJSONResponse:
     """
-    tasks: list[models.Task] = crud.get_tasks(db, user_id=current_user.id)
-    return tasks
+    Ищет задачи текущего пользователя по заголовку.
+
+    Бэкенд поиска (Левенштейн или pg_trgm) выбирается настройкой `SEARCH_BACKEND`.
+
+    Args:
+        query (str): Поисковый запрос.
+        limit (int): Максимальное количество задач в ответе. По умолчанию `SEARCH_LIMIT`.
+        current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
+
+    Returns:
+        ORJSONResponse: Список найденных задач (см. `schemas.Task`), от наиболее похожих к наименее.
+    """
+    tasks: list[models.Task] = await crud.search_tasks(db, user_id=current_user.id, query=query, limit=limit)
+    return ORJSONResponse([_task_payload(task) for task in tasks])
 
 
 @api_router.post("/tasks", response_model=schemas.Task)
 async def create_task(
     task: schemas.TaskCreate,  # Данные для создания задачи
     current_user: models.User = Depends(get_current_user),  # Текущий пользователь
-    db: Session = Depends(get_db)  # Сессия базы данных
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
 ) -> schemas.Task:
     """
     Создает новую задачу для текущего пользователя.
@@ -77,21 +373,54 @@ async def create_task(
     Args:
         task (schemas.TaskCreate): Данные для создания задачи.
         current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
         schemas.Task: Созданная задача.
     """
-    db_task: models.Task = crud.create_task(db, task, user_id=current_user.id)
+    db_task: models.Task = await crud.create_task(db, task, user_id=current_user.id)
     return db_task
 
 
+@api_router.post("/tasks/batch", response_model=schemas.TaskBatchResult)
+async def batch_tasks(
+    batch: schemas.TaskBatch,  # Пакет операций над задачами
+    current_user: models.User = Depends(get_current_user),  # Текущий пользователь
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
+) -> schemas.TaskBatchResult:
+    """
+    Создает, обновляет и удаляет задачи текущего пользователя одним запросом.
+
+    Все операции выполняются в одной транзакции. Операции над задачами, которые не найдены
+    или не принадлежат текущему пользователю, пропускаются и возвращаются со статусом "forbidden".
+
+    Args:
+        batch (schemas.TaskBatch): Пакет операций.
+        current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
+
+    Returns:
+        schemas.TaskBatchResult: Результаты операций в порядке запроса.
+
+    Raises:
+        HTTPException: Если количество операций превышает `TASK_BATCH_LIMIT`.
+    """
+    if len(batch.create) + len(batch.update) + len(batch.delete) > TASK_BATCH_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch is limited to {TASK_BATCH_LIMIT} operations"
+        )
+
+    results = await crud.apply_task_batch(db, current_user.id, batch)
+    return {"results": results}
+
+
 @api_router.put("/tasks/{task_id}", response_model=schemas.Task)
 async def update_task(
     task_id: int,  # Идентификатор задачи
     task: schemas.TaskCreate,  # Данные для обновления задачи
     current_user: models.User = Depends(get_current_user),  # Текущий пользователь
-    db: Session = Depends(get_db)  # Сессия базы данных
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
 ) -> schemas.Task:
     """
     Обновляет задачу по её идентификатору.
@@ -102,7 +431,7 @@ async def update_task(
         task_id (int): Идентификатор задачи.
         task (schemas.TaskCreate): Данные для обновления задачи.
         current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
         schemas.Task: Обновленная задача.
@@ -110,11 +439,9 @@ async def update_task(
     Raises:
         HTTPException: Если задача не найдена или не принадлежит текущему пользователю.
     """
-    existing_task: models.Task | None = crud.get_task(db, task_id)
-    if existing_task is None or existing_task.owner_id != current_user.id:
+    updated_task: models.Task | None = await crud.update_task(db, task_id, task, user_id=current_user.id)
+    if updated_task is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
-
-    updated_task: models.Task = crud.update_task(db, task_id, task)
     return updated_task
 
 
@@ -122,7 +449,7 @@ async def update_task(
 async def delete_task(
     task_id: int,  # Идентификатор задачи
     current_user: models.User = Depends(get_current_user),  # Текущий пользователь
-    db: Session = Depends(get_db)  # Сессия базы данных
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
 ) -> dict[str, str]:
     """
     Удаляет задачу по её идентификатору.
@@ -132,7 +459,7 @@ async def delete_task(
     Args:
         task_id (int): Идентификатор задачи.
         current_user (models.User): Текущий пользователь, полученный через зависимость `get_current_user`.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
         dict[str, str]: Сообщение об успешном удалении задачи.
@@ -140,9 +467,39 @@ async def delete_task(
     Raises:
         HTTPException: Если задача не найдена или не принадлежит текущему пользователю.
     """
-    existing_task: models.Task | None = crud.get_task(db, task_id)
-    if existing_task is None or existing_task.owner_id != current_user.id:
+    if not await crud.delete_task(db, task_id, user_id=current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
-
-    crud.delete_task(db, task_id)
     return {"message": "Task deleted successfully"}
+
+
+# Внутренние метрики: доступны только авторизованным пользователям и не попадают в схему OpenAPI
+metrics_router = APIRouter(
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(get_current_user)],
+    include_in_schema=False
+)
+
+
+@metrics_router.get("/metrics/hashing", response_model=dict)
+async def hashing_metrics() -> dict[str, float]:
+    """
+    Возвращает метрики пула хэширования паролей: глубину очереди, количество выполненных
+    и отклоненных задач, а также задержки ожидания и хэширования.
+
+    Returns:
+        dict[str, float]: Метрики пула `password_hasher`.
+    """
+    return password_hasher.stats()
+
+
+@metrics_router.get("/metrics/db_pool", response_model=dict)
+async def db_pool_metrics() -> dict[str, int]:
+    """
+    Возвращает состояние пула соединений с базой данных текущего воркера:
+    выданные и свободные соединения, дополнительные соединения сверх `DB_POOL_SIZE`
+    и количество запросов, ожидающих соединение.
+
+    Returns:
+        dict[str, int]: Метрики пула соединений.
+    """
+    return pool_stats()
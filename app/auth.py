@@ -1,11 +1,23 @@
 """
 Модуль для работы с паролями и их хэшированием с использованием библиотеки bcrypt.
 
-Этот модуль предоставляет функции для проверки пароля и генерации хэша пароля.
+Этот модуль предоставляет функции для проверки пароля и генерации хэша пароля,
+а также их асинхронные версии, которые выполняют bcrypt в ограниченном пуле потоков
+и не блокируют цикл событий.
 """
 
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Callable, Deque, Dict, List, Tuple, TypeVar
+
 import bcrypt
 
+from .configs.configs import HASH_POOL_SIZE, HASH_QUEUE_LIMIT
+
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -35,3 +47,173 @@ def get_password_hash(password: str) -> str:
     salt: bytes = bcrypt.gensalt()
     hashed_password: bytes = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed_password.decode('utf-8')
+
+
+class HashingOverloadedError(Exception):
+    """
+    Исключение, которое выбрасывается, когда очередь пула хэширования заполнена.
+    """
+
+
+class PasswordHasher:
+    """
+    Ограниченный пул потоков для выполнения bcrypt вне цикла событий.
+
+    bcrypt освобождает GIL во время вычисления хэша, поэтому потоки выполняют его параллельно.
+    Одновременно в пуле находится не более `max_workers + queue_limit` задач. Если лимит исчерпан,
+    новые задачи сразу отклоняются с `HashingOverloadedError`, а не ждут в неограниченной очереди.
+
+    Атрибуты:
+        max_workers (int): Количество потоков пула.
+        queue_limit (int): Максимальное количество задач, ожидающих свободный поток.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int, latency_window: int = 1000) -> None:
+        self.max_workers: int = max_workers
+        self.queue_limit: int = queue_limit
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="bcrypt"
+        )
+        self._pending: int = 0
+        self._completed: int = 0
+        self._rejected: int = 0
+        self._hash_times: Deque[float] = deque(maxlen=latency_window)
+        self._wait_times: Deque[float] = deque(maxlen=latency_window)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Выполняет функцию в пуле потоков и учитывает время ожидания и выполнения.
+
+        Args:
+            func (Callable[..., T]): Функция, выполняющая bcrypt.
+            *args (Any): Аргументы функции.
+
+        Returns:
+            T: Результат функции.
+
+        Raises:
+            HashingOverloadedError: Если очередь пула заполнена.
+        """
+        if self._pending >= self.max_workers + self.queue_limit:
+            self._rejected += 1
+            raise HashingOverloadedError("Password hashing queue is full")
+
+        submitted_at = time.perf_counter()
+
+        def timed_call() -> Tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at - submitted_at, time.perf_counter() - started_at
+
+        self._pending += 1
+        try:
+            result, wait_time, hash_time = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed_call
+            )
+        finally:
+            self._pending -= 1
+
+        self._completed += 1
+        self._wait_times.append(wait_time)
+        self._hash_times.append(hash_time)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Возвращает метрики пула: глубину очереди, счетчики и задержки (в миллисекундах)
+        по последним выполненным задачам.
+
+        Returns:
+            Dict[str, Any]: Словарь с метриками.
+        """
+        hash_times = sorted(self._hash_times)
+        wait_times = sorted(self._wait_times)
+        return {
+            "workers": self.max_workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self._pending,
+            "queue_depth": max(0, self._pending - self.max_workers),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "hash_ms_avg": _avg_ms(hash_times),
+            "hash_ms_p95": _percentile_ms(hash_times, 0.95),
+            "hash_ms_max": _percentile_ms(hash_times, 1.0),
+            "wait_ms_avg": _avg_ms(wait_times),
+            "wait_ms_p95": _percentile_ms(wait_times, 0.95),
+        }
+
+    def shutdown(self) -> None:
+        """
+        Останавливает пул потоков, дождавшись завершения начатых задач.
+        """
+        self._executor.shutdown(wait=True)
+
+
+def _avg_ms(values: List[float]) -> float:
+    """
+    Вычисляет среднее значение длительностей в миллисекундах.
+
+    Args:
+        values (List[float]): Длительности в секундах.
+
+    Returns:
+        float: Среднее значение в миллисекундах, округленное до сотых, или 0 для пустого списка.
+    """
+    return round(sum(values) / len(values) * 1000, 2) if values else 0.0
+
+
+def _percentile_ms(sorted_values: List[float], quantile: float) -> float:
+    """
+    Вычисляет квантиль длительностей в миллисекундах.
+
+    Args:
+        sorted_values (List[float]): Длительности в секундах, отсортированные по возрастанию.
+        quantile (float): Квантиль от 0 до 1 (например, 0.95 для p95, 1.0 для максимума).
+
+    Returns:
+        float: Значение квантиля в миллисекундах, округленное до сотых, или 0 для пустого списка.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(quantile * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 2)
+
+
+password_hasher: PasswordHasher = PasswordHasher(max_workers=HASH_POOL_SIZE, queue_limit=HASH_QUEUE_LIMIT)
+"""
+Глобальный пул для хэширования и проверки паролей.
+"""
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Проверяет пароль в пуле потоков `password_hasher`, не блокируя цикл событий.
+
+    Args:
+        plain_password (str): Обычный пароль, введенный пользователем.
+        hashed_password (str): Хэшированный пароль, сохраненный в базе данных.
+
+    Returns:
+        bool: True, если пароль совпадает с хэшированной версией, иначе False.
+
+    Raises:
+        HashingOverloadedError: Если очередь пула заполнена.
+    """
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Генерирует хэш пароля в пуле потоков `password_hasher`, не блокируя цикл событий.
+
+    Args:
+        password (str): Обычный пароль, который нужно хэшировать.
+
+    Returns:
+        str: Хэшированный пароль в виде строки.
+
+    Raises:
+        HashingOverloadedError: Если очередь пула заполнена.
+    """
+    return await password_hasher.run(get_password_hash, password)
@@ -0,0 +1,313 @@
+"""
+Модуль для кэширования данных в памяти процесса.
+
+Этот модуль предоставляет LRU-кэш с ограниченным временем жизни записей (TTL)
+и экземпляры кэшей, которые используются приложением.
+
+Кэши хранятся в памяти процесса: при запуске нескольких воркеров каждый из них держит
+собственную копию, поэтому время жизни записей выбирается так, чтобы ограничить
+устаревание данных, изменённых в другом воркере.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .configs.configs import (
+    NEAR_DEADLINE_CACHE_SIZE,
+    NEAR_DEADLINE_CACHE_SLACK,
+    PAGE_CACHE_SIZE,
+    PAGE_CACHE_TTL,
+    SESSION_CACHE_SIZE,
+    SESSION_CACHE_TTL,
+    TASK_CARD_CACHE_SIZE,
+    TASK_CARD_CACHE_TTL,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU-кэш с ограниченным временем жизни записей.
+
+    При превышении `maxsize` вытесняются давно не использовавшиеся записи,
+    а записи старше своего TTL считаются отсутствующими.
+
+    Атрибуты:
+        maxsize (int): Максимальное количество записей.
+        ttl (float): Время жизни записи по умолчанию в секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Возвращает значение по ключу, если запись существует и не истекла.
+
+        Args:
+            key (K): Ключ записи.
+
+        Returns:
+            Optional[V]: Значение записи или None.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Сохраняет значение по ключу.
+
+        Args:
+            key (K): Ключ записи.
+            value (V): Значение записи.
+            ttl (Optional[float]): Время жизни записи в секундах. По умолчанию `self.ttl`.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """
+        Удаляет запись по ключу. Отсутствующие ключи игнорируются.
+
+        Args:
+            key (K): Ключ записи.
+        """
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        Удаляет все записи, для которых `predicate(key, value)` истинно.
+
+        Args:
+            predicate (Callable[[K, V], bool]): Условие удаления записи.
+
+        Returns:
+            int: Количество удаленных записей.
+        """
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Удаляет все записи.
+        """
+        self._data.clear()
+
+
+@dataclass(frozen=True)
+class SessionEntry:
+    """
+    Данные пользователя, связанного с действительной сессией.
+
+    Атрибуты:
+        user_id (int): Идентификатор пользователя.
+        username (str): Имя пользователя.
+        hashed_password (str): Хэшированный пароль пользователя.
+        expires_at (datetime): Время истечения сессии (UTC).
+    """
+    user_id: int
+    username: str
+    hashed_password: str
+    expires_at: datetime
+
+
+session_cache: TTLCache[str, SessionEntry] = TTLCache(maxsize=SESSION_CACHE_SIZE, ttl=SESSION_CACHE_TTL)
+"""
+Кэш сессий по токену. Сбрасывается функциями `crud.delete_session` и `crud.update_user_password`.
+"""
+
+
+@dataclass(frozen=True)
+class NearDeadlineEntry:
+    """
+    Задачи пользователя со сроком в окне `(fetched_at, window_end]`.
+
+    Окно шире суток на `NEAR_DEADLINE_CACHE_SLACK` секунд, поэтому пока запись жива,
+    любая задача, входящая в суточное окно, уже содержится в ней.
+
+    Атрибуты:
+        window_end (datetime): Правая граница окна (UTC).
+        tasks (Tuple[Tuple[datetime, Dict[str, Any]], ...]): Пары (срок, задача в виде словаря), упорядоченные по сроку.
+    """
+    window_end: datetime
+    tasks: Tuple[Tuple[datetime, Dict[str, Any]], ...]
+
+
+near_deadline_cache: TTLCache[int, NearDeadlineEntry] = TTLCache(
+    maxsize=NEAR_DEADLINE_CACHE_SIZE,
+    ttl=NEAR_DEADLINE_CACHE_SLACK
+)
+"""
+Кэш задач с приближающимся сроком по идентификатору пользователя.
+Сбрасывается при любом изменении задач пользователя в `crud`.
+"""
+
+
+task_card_cache: TTLCache[int, Tuple[int, str]] = TTLCache(maxsize=TASK_CARD_CACHE_SIZE, ttl=TASK_CARD_CACHE_TTL)
+"""
+Кэш отрендеренных карточек задач по идентификатору задачи: пары (версия задачи, HTML карточки).
+Запись используется только при совпадении версии и сбрасывается функциями `crud`,
+которые изменяют или удаляют задачу.
+"""
+
+
+@dataclass(frozen=True)
+class PageEntry:
+    """
+    Отрендеренная HTML-страница пользователя.
+
+    Атрибуты:
+        stamp (int): Версия данных пользователя, для которой отрендерена страница.
+        body (bytes): Тело ответа.
+        etag (Optional[str]): ETag страницы или None.
+        last_modified (Optional[datetime]): Время последнего изменения страницы (UTC) или None.
+    """
+    stamp: int
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class PageCache:
+    """
+    Кэш отрендеренных HTML-страниц по пользователю и адресу страницы.
+
+    Для каждого пользователя хранится версия (stamp), которая меняется при любом
+    изменении его задач. Запись используется, только если она сохранена при текущей версии,
+    поэтому сброс всех страниц пользователя не требует перебора записей.
+
+    Версии хранятся в `TTLCache` того же размера и с тем же временем жизни, что и страницы.
+    Новая версия берется из общего для всех пользователей счетчика, поэтому после вытеснения
+    версии пользователя его сохраненные страницы уже не совпадут с новой версией.
+
+    Атрибуты:
+        maxsize (int): Максимальное количество страниц.
+        ttl (float): Время жизни страницы в секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._pages: TTLCache[Tuple[int, str], PageEntry] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._stamps: TTLCache[int, int] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._last_stamp: int = 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, user_id: int, key: str) -> Optional[PageEntry]:
+        """
+        Возвращает страницу пользователя, если она сохранена при текущей версии его данных.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            key (str): Адрес страницы вместе со строкой запроса.
+
+        Returns:
+            Optional[PageEntry]: Страница или None.
+        """
+        entry = self._pages.get((user_id, key))
+        if entry is None or entry.stamp != self._stamps.get(user_id):
+            return None
+        return entry
+
+    def stamp(self, user_id: int) -> int:
+        """
+        Возвращает текущую версию данных пользователя.
+
+        Версию нужно получить до чтения данных для страницы и передать в `set`: если данные
+        изменятся во время рендеринга, страница сохранится со старой версией и не будет использована.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            int: Версия данных пользователя.
+        """
+        stamp = self._stamps.get(user_id)
+        if stamp is None:
+            stamp = self._new_stamp(user_id)
+        return stamp
+
+    def set(
+        self,
+        user_id: int,
+        key: str,
+        stamp: int,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None
+    ) -> None:
+        """
+        Сохраняет страницу пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            key (str): Адрес страницы вместе со строкой запроса.
+            stamp (int): Версия данных пользователя, полученная через `stamp` до чтения данных.
+            body (bytes): Тело ответа.
+            etag (Optional[str]): ETag страницы. По умолчанию None.
+            last_modified (Optional[datetime]): Время последнего изменения страницы. По умолчанию None.
+        """
+        if stamp != self._stamps.get(user_id):
+            # Данные изменились во время рендеринга: страница уже устарела
+            return
+        # Продлевает жизнь версии, пока по ней сохраняются страницы
+        self._stamps.set(user_id, stamp)
+        self._pages.set((user_id, key), PageEntry(stamp, body, etag, last_modified))
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Делает недействительными все страницы пользователя, назначая новую версию его данных.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+        """
+        self._new_stamp(user_id)
+
+    def _new_stamp(self, user_id: int) -> int:
+        """
+        Назначает пользователю новую версию данных из общего счетчика.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            int: Новая версия данных пользователя.
+        """
+        self._last_stamp += 1
+        self._stamps.set(user_id, self._last_stamp)
+        return self._last_stamp
+
+    def clear(self) -> None:
+        """
+        Удаляет все страницы.
+        """
+        self._pages.clear()
+        self._stamps.clear()
+
+
+page_cache: PageCache = PageCache(maxsize=PAGE_CACHE_SIZE, ttl=PAGE_CACHE_TTL)
+"""
+Кэш HTML-страниц авторизованных пользователей (`/`, `/tasks`, `/tasks/{task_id}`).
+Версия страниц пользователя меняется при любом изменении его задач в `crud`.
+"""
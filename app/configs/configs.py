@@ -10,6 +10,9 @@ load_dotenv(os.path.join(os.path.dirname(__file__), '.', 'config.env'))
 APP_HOST: str = os.getenv('APP_HOST')
 APP_PORT: int = int(os.getenv('APP_PORT'))
 
+# Режим работы: "production" или "development" (в режиме разработки шаблоны перечитываются при изменении)
+APP_ENV: str = os.getenv('APP_ENV', 'production')
+
 
 # Переменные окружения для базы данных
 DB_LOGIN: str = os.getenv('DB_LOGIN')
@@ -21,3 +24,91 @@ DB_NAME: str = os.getenv('DB_NAME')
 DB_HOST: str = os.getenv('DB_HOST')
 
 DB_PORT: int = os.getenv('DB_PORT')
+
+
+# Переменные окружения для пула соединений с базой данных
+DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 5))
+
+DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', 10))
+
+DB_POOL_TIMEOUT: float = float(os.getenv('DB_POOL_TIMEOUT', 30))
+
+DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', 1800))
+
+DB_POOL_PRE_PING: bool = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+
+# Ограничение времени выполнения запроса в миллисекундах (0 - без ограничения)
+DB_STATEMENT_TIMEOUT: int = int(os.getenv('DB_STATEMENT_TIMEOUT', 0))
+
+
+# Переменные окружения для поиска задач
+SEARCH_INDEX_MAX_USERS: int = int(os.getenv('SEARCH_INDEX_MAX_USERS', 1000))
+
+# Бэкенд поиска: "levenshtein" (индекс в памяти процесса) или "pg_trgm" (ранжирование в PostgreSQL)
+SEARCH_BACKEND: str = os.getenv('SEARCH_BACKEND', 'levenshtein')
+
+SEARCH_LIMIT: int = int(os.getenv('SEARCH_LIMIT', 50))
+
+SEARCH_TRGM_THRESHOLD: float = float(os.getenv('SEARCH_TRGM_THRESHOLD', 0.3))
+
+
+# Переменные окружения для пула хэширования паролей (bcrypt)
+HASH_POOL_SIZE: int = int(os.getenv('HASH_POOL_SIZE', 4))
+
+HASH_QUEUE_LIMIT: int = int(os.getenv('HASH_QUEUE_LIMIT', 64))
+
+
+# Переменные окружения для кэша сессий
+SESSION_CACHE_SIZE: int = int(os.getenv('SESSION_CACHE_SIZE', 10000))
+
+SESSION_CACHE_TTL: int = int(os.getenv('SESSION_CACHE_TTL', 60))
+
+
+# Переменные окружения для фоновой очистки истекших сессий
+SESSION_REAPER_INTERVAL: int = int(os.getenv('SESSION_REAPER_INTERVAL', 3600))
+
+SESSION_REAPER_BATCH_SIZE: int = int(os.getenv('SESSION_REAPER_BATCH_SIZE', 1000))
+
+
+# Уровень логирования приложения
+LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+
+
+# Переменные окружения для кэша задач с приближающимся сроком
+NEAR_DEADLINE_CACHE_SIZE: int = int(os.getenv('NEAR_DEADLINE_CACHE_SIZE', 10000))
+
+NEAR_DEADLINE_CACHE_SLACK: int = int(os.getenv('NEAR_DEADLINE_CACHE_SLACK', 300))
+
+
+# Переменные окружения для уведомлений о сроках (Server-Sent Events)
+DEADLINE_RESYNC_INTERVAL: int = int(os.getenv('DEADLINE_RESYNC_INTERVAL', 3600))
+
+SSE_KEEPALIVE_INTERVAL: int = int(os.getenv('SSE_KEEPALIVE_INTERVAL', 15))
+
+
+# Переменные окружения для пакетных операций API, экспорта и импорта
+TASK_BATCH_LIMIT: int = int(os.getenv('TASK_BATCH_LIMIT', 1000))
+
+EXPORT_BATCH_SIZE: int = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+
+IMPORT_CHUNK_SIZE: int = int(os.getenv('IMPORT_CHUNK_SIZE', 1000))
+
+IMPORT_MAX_ERRORS: int = int(os.getenv('IMPORT_MAX_ERRORS', 1000))
+
+
+# Переменные окружения для шаблонов Jinja2
+TEMPLATE_BYTECODE_CACHE: bool = os.getenv('TEMPLATE_BYTECODE_CACHE', 'true').lower() == 'true'
+
+# Каталог кэша байт-кода шаблонов (пустая строка - временный каталог системы)
+TEMPLATE_BYTECODE_CACHE_DIR: str = os.getenv('TEMPLATE_BYTECODE_CACHE_DIR', '')
+
+# Переменные окружения для кэша отрендеренных карточек задач
+TASK_CARD_CACHE_SIZE: int = int(os.getenv('TASK_CARD_CACHE_SIZE', 10000))
+
+TASK_CARD_CACHE_TTL: int = int(os.getenv('TASK_CARD_CACHE_TTL', 3600))
+
+# Переменные окружения для кэша HTML-страниц авторизованных пользователей
+PAGE_CACHE_SIZE: int = int(os.getenv('PAGE_CACHE_SIZE', 10000))
+
+# Время жизни страницы в секундах; ограничивает устаревание после изменений в другом воркере
+PAGE_CACHE_TTL: int = int(os.getenv('PAGE_CACHE_TTL', 30))
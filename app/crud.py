@@ -1,53 +1,127 @@
 """
 Модуль для работы с CRUD-операциями (создание, чтение, обновление, удаление) для моделей базы данных.
 
-Этот модуль предоставляет функции для работы с пользователями, задачами и сессиями.
+Этот модуль предоставляет асинхронные функции для работы с пользователями, задачами и сессиями.
+Все функции принимают `AsyncSession` и не блокируют цикл событий во время запросов к базе данных.
 """
 
 from datetime import datetime, timedelta, timezone
 import secrets
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
-from Levenshtein import distance as levenshtein_distance
+import asyncpg
+from sqlalchemy import Select, delete, func, insert, select, update
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from . import models, schemas
+from .cache import NearDeadlineEntry, near_deadline_cache, page_cache, session_cache, task_card_cache
+from .configs.configs import NEAR_DEADLINE_CACHE_SLACK, SEARCH_BACKEND, SEARCH_LIMIT, SEARCH_TRGM_THRESHOLD
+from .scheduler import deadline_scheduler
+from .search_index import title_index
 
 
-def get_user(db: Session, user_id: int) -> Optional[models.User]:
+def utcnow() -> datetime:
+    """
+    Возвращает текущее время в UTC без информации о часовом поясе.
+
+    Столбцы `DateTime` хранят время без часового пояса, а драйвер asyncpg
+    не принимает для них значения с часовым поясом.
+
+    Returns:
+        datetime: Текущее время в UTC.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Приводит время с часовым поясом к UTC без часового пояса. Остальные значения возвращаются как есть.
+
+    Args:
+        value (Optional[datetime]): Время или None.
+
+    Returns:
+        Optional[datetime]: Время без часового пояса или None.
+    """
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _on_tasks_changed(user_id: int) -> None:
+    """
+    Сбрасывает кэши, которые зависят от задач пользователя.
+
+    Вызывается после фиксации любого изменения задач пользователя.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+    """
+    near_deadline_cache.pop(user_id)
+    page_cache.invalidate(user_id)
+
+
+async def _bump_tasks_version(db: AsyncSession, user_id: int, now: datetime) -> int:
+    """
+    Увеличивает версию списка задач пользователя в текущей транзакции.
+
+    Вызывается перед фиксацией любого изменения задач пользователя. Возвращенная версия
+    записывается в `change_seq` измененных задач и записей об удаленных задачах.
+    Строка пользователя блокируется до конца транзакции, поэтому версии изменений одного
+    пользователя фиксируются в порядке возрастания.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        now (datetime): Время изменения (UTC).
+
+    Returns:
+        int: Новая версия списка задач.
+    """
+    return await db.scalar(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(tasks_version=models.User.tasks_version + 1, tasks_updated_at=now)
+        .returning(models.User.tasks_version)
+    )
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[models.User]:
     """
     Получает пользователя по его идентификатору.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
 
     Returns:
         Optional[models.User]: Объект пользователя, если найден, иначе None.
     """
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return await db.scalar(select(models.User).where(models.User.id == user_id))
 
 
-def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[models.User]:
     """
     Получает пользователя по его имени пользователя.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         username (str): Имя пользователя.
 
     Returns:
         Optional[models.User]: Объект пользователя, если найден, иначе None.
     """
-    return db.query(models.User).filter(models.User.username == username).first()
+    return await db.scalar(select(models.User).where(models.User.username == username))
 
 
-def create_user(db: Session, user: schemas.UserCreate, hashed_password: str) -> models.User:
+async def create_user(db: AsyncSession, user: schemas.UserCreate, hashed_password: str) -> models.User:
     """
     Создает нового пользователя.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user (schemas.UserCreate): Данные для создания пользователя.
         hashed_password (str): Хэшированный пароль пользователя.
 
@@ -56,165 +130,670 @@ def create_user(db: Session, user: schemas.UserCreate, hashed_password: str) ->
     """
     db_user = models.User(username=user.username, hashed_password=hashed_password)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
     return db_user
 
 
-def update_user_password(db: Session, user_id: int, hashed_password: str) -> Optional[models.User]:
+async def update_user_password(db: AsyncSession, user_id: int, hashed_password: str) -> Optional[models.User]:
     """
     Обновляет пароль пользователя.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
         hashed_password (str): Новый хэшированный пароль.
 
     Returns:
         Optional[models.User]: Обновленный объект пользователя, если найден, иначе None.
     """
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = await db.scalar(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(hashed_password=hashed_password)
+        .returning(models.User)
+        .execution_options(populate_existing=True)
+    )
+    await db.commit()
     if user:
-        user.hashed_password = hashed_password
-        db.commit()
-        db.refresh(user)
+        session_cache.pop_where(lambda _, entry: entry.user_id == user_id)
     return user
 
 
-def get_tasks(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.Task]:
+def _filter_tasks(
+    query: Select,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None
+) -> Select:
+    """
+    Добавляет к запросу задач условия фильтрации. Неуказанные условия не применяются.
+
+    Args:
+        query (Select): Запрос задач.
+        status (Optional[str]): Статус задачи.
+        priority (Optional[str]): Приоритет задачи.
+        deadline_from (Optional[datetime]): Нижняя граница срока выполнения (включительно).
+        deadline_to (Optional[datetime]): Верхняя граница срока выполнения (включительно).
+
+    Returns:
+        Select: Запрос с условиями фильтрации.
+    """
+    if status is not None:
+        query = query.where(models.Task.status == status)
+    if priority is not None:
+        query = query.where(models.Task.priority == priority)
+    if deadline_from is not None:
+        query = query.where(models.Task.deadline >= _to_naive_utc(deadline_from))
+    if deadline_to is not None:
+        query = query.where(models.Task.deadline <= _to_naive_utc(deadline_to))
+    return query
+
+
+async def get_tasks(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None
+) -> List[models.Task]:
     """
-    Получает список задач пользователя с пагинацией.
+    Получает список задач пользователя с курсорной (keyset) пагинацией и фильтрацией.
+
+    Задачи упорядочены по идентификатору. Следующая страница запрашивается с `after_id`,
+    равным идентификатору последней задачи предыдущей страницы, поэтому стоимость запроса
+    не зависит от глубины страницы, в отличие от OFFSET.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
-        skip (int): Количество задач для пропуска (пагинация). По умолчанию 0.
-        limit (int): Максимальное количество задач для возврата (пагинация). По умолчанию 100.
+        limit (int): Максимальное количество задач для возврата. По умолчанию 100.
+        after_id (Optional[int]): Идентификатор задачи, после которой начинается страница. По умолчанию None.
+        status (Optional[str]): Фильтр по статусу. По умолчанию None.
+        priority (Optional[str]): Фильтр по приоритету. По умолчанию None.
+        deadline_from (Optional[datetime]): Нижняя граница срока выполнения. По умолчанию None.
+        deadline_to (Optional[datetime]): Верхняя граница срока выполнения. По умолчанию None.
 
     Returns:
         List[models.Task]: Список задач пользователя.
     """
-    return db.query(models.Task).filter(models.Task.owner_id == user_id).offset(skip).limit(limit).all()
+    query = _filter_tasks(
+        select(models.Task).where(models.Task.owner_id == user_id),
+        status, priority, deadline_from, deadline_to
+    )
+    if after_id is not None:
+        query = query.where(models.Task.id > after_id)
+    tasks = await db.scalars(query.order_by(models.Task.id).limit(limit))
+    return list(tasks)
+
+
+async def get_tasks_by_status(
+    db: AsyncSession,
+    user_id: int,
+    status: str,
+    limit: int = 100,
+    priority: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None
+) -> List[models.Task]:
+    """
+    Получает задачи пользователя с одним статусом, упорядоченные по приоритету (сначала высокий).
+
+    Сортировка выполняется в базе данных по выражению `models.TASK_PRIORITY_RANK`, по которому
+    построен индекс `ix_tasks_owner_id_status_priority_rank`, поэтому задачи читаются из индекса
+    уже упорядоченными.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        status (str): Статус задач.
+        limit (int): Максимальное количество задач для возврата. По умолчанию 100.
+        priority (Optional[str]): Фильтр по приоритету. По умолчанию None.
+        deadline_from (Optional[datetime]): Нижняя граница срока выполнения. По умолчанию None.
+        deadline_to (Optional[datetime]): Верхняя граница срока выполнения. По умолчанию None.
+
+    Returns:
+        List[models.Task]: Список задач с указанным статусом.
+    """
+    query = _filter_tasks(
+        select(models.Task).where(models.Task.owner_id == user_id),
+        status, priority, deadline_from, deadline_to
+    )
+    tasks = await db.scalars(query.order_by(models.TASK_PRIORITY_RANK, models.Task.id).limit(limit))
+    return list(tasks)
 
 
-def create_task(db: Session, task: schemas.TaskCreate, user_id: int) -> models.Task:
+async def create_task(db: AsyncSession, task: schemas.TaskCreate, user_id: int) -> models.Task:
     """
     Создает новую задачу для пользователя.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         task (schemas.TaskCreate): Данные для создания задачи.
         user_id (int): Идентификатор пользователя.
 
     Returns:
         models.Task: Созданный объект задачи.
     """
-    db_task = models.Task(**task.dict(), owner_id=user_id)
+    now = utcnow()
+    change_seq = await _bump_tasks_version(db, user_id, now)
+    db_task = models.Task(**task.dict(), owner_id=user_id, updated_at=now, change_seq=change_seq)
+    db_task.deadline = _to_naive_utc(db_task.deadline)
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await db.commit()
+    title_index.add(user_id, change_seq, db_task.id, db_task.title)
+    deadline_scheduler.schedule(db_task.id, user_id, db_task.deadline, task_to_dict(db_task))
+    _on_tasks_changed(user_id)
     return db_task
 
 
-def get_task(db: Session, task_id: int) -> Optional[models.Task]:
+async def get_tasks_version(db: AsyncSession, user_id: int) -> Tuple[int, Optional[datetime]]:
+    """
+    Получает версию списка задач пользователя одним запросом по первичному ключу.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+
+    Returns:
+        Tuple[int, Optional[datetime]]: Версия списка задач и время его последнего изменения (UTC).
+    """
+    row = (await db.execute(
+        select(models.User.tasks_version, models.User.tasks_updated_at).where(models.User.id == user_id)
+    )).one_or_none()
+    return (row.tasks_version, row.tasks_updated_at) if row else (0, None)
+
+
+async def get_task_changes(
+    db: AsyncSession,
+    user_id: int,
+    since: int
+) -> Tuple[int, List[models.Task], List[int]]:
+    """
+    Получает изменения задач пользователя после версии списка `since`.
+
+    Версия списка читается первой: все изменения с номером не больше нее уже зафиксированы,
+    поэтому клиент, передавший ее в следующем запросе, не пропустит изменений.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        since (int): Последняя известная клиенту версия списка задач. 0 — полная синхронизация.
+
+    Returns:
+        Tuple[int, List[models.Task], List[int]]: Текущая версия списка, созданные или измененные задачи
+        и идентификаторы удаленных задач (при `since` = 0 удаленные задачи не возвращаются).
+    """
+    version, _ = await get_tasks_version(db, user_id)
+
+    query = select(models.Task).where(models.Task.owner_id == user_id)
+    deleted_ids: List[int] = []
+    if since > 0:
+        query = query.where(models.Task.change_seq > since)
+        deleted_ids = list(await db.scalars(
+            select(models.TaskTombstone.task_id)
+            .where(models.TaskTombstone.owner_id == user_id, models.TaskTombstone.change_seq > since)
+            .order_by(models.TaskTombstone.change_seq, models.TaskTombstone.task_id)
+        ))
+    tasks = await db.scalars(query.order_by(models.Task.change_seq, models.Task.id))
+    return version, list(tasks), deleted_ids
+
+
+async def stream_tasks(db: AsyncSession, user_id: int, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Построчно читает все задачи пользователя через серверный курсор.
+
+    Выбираются только столбцы (без ORM-объектов и карты идентичности), а строки
+    забираются из базы данных пачками по `batch_size`, поэтому память не зависит
+    от количества задач.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        batch_size (int): Количество строк, забираемых из курсора за раз.
+
+    Yields:
+        List[Dict[str, Any]]: Пачка задач в виде словарей, упорядоченных по идентификатору.
+    """
+    task = models.Task
+    result = await db.stream(
+        select(task.id, task.title, task.description, task.status, task.priority, task.deadline, task.owner_id)
+        .where(task.owner_id == user_id)
+        .order_by(task.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for rows in result.mappings().partitions():
+        yield [dict(row) for row in rows]
+
+
+async def get_task(db: AsyncSession, task_id: int) -> Optional[models.Task]:
     """
     Получает задачу по её идентификатору.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         task_id (int): Идентификатор задачи.
 
     Returns:
         Optional[models.Task]: Объект задачи, если найден, иначе None.
     """
-    return db.query(models.Task).filter(models.Task.id == task_id).first()
+    return await db.scalar(select(models.Task).where(models.Task.id == task_id))
 
 
-def update_task(db: Session, task_id: int, task: schemas.TaskCreate) -> Optional[models.Task]:
+async def get_user_task(db: AsyncSession, task_id: int, user_id: int) -> Optional[models.Task]:
     """
-    Обновляет задачу.
+    Получает задачу пользователя по её идентификатору. Принадлежность проверяется в том же запросе.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
+        task_id (int): Идентификатор задачи.
+        user_id (int): Идентификатор владельца задачи.
+
+    Returns:
+        Optional[models.Task]: Объект задачи, если она найдена и принадлежит пользователю, иначе None.
+    """
+    return await db.scalar(
+        select(models.Task).where(models.Task.id == task_id, models.Task.owner_id == user_id)
+    )
+
+
+async def update_task(db: AsyncSession, task_id: int, task: schemas.TaskCreate, user_id: int) -> Optional[models.Task]:
+    """
+    Обновляет задачу пользователя.
+
+    Задача обновляется одним запросом `UPDATE ... WHERE id AND owner_id RETURNING`, который
+    одновременно проверяет принадлежность и возвращает обновленную строку, поэтому
+    предварительная выборка и повторная загрузка после фиксации не нужны.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
         task_id (int): Идентификатор задачи.
         task (schemas.TaskCreate): Новые данные для задачи.
+        user_id (int): Идентификатор владельца задачи.
 
     Returns:
-        Optional[models.Task]: Обновленный объект задачи, если найден, иначе None.
+        Optional[models.Task]: Обновленный объект задачи или None, если задача не найдена
+        или не принадлежит пользователю.
     """
-    db_task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    now = utcnow()
+    change_seq = await _bump_tasks_version(db, user_id, now)
+    db_task = await db.scalar(
+        update(models.Task)
+        .where(models.Task.id == task_id, models.Task.owner_id == user_id)
+        .values(
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            priority=task.priority,
+            deadline=_to_naive_utc(task.deadline),
+            version=models.Task.version + 1,
+            updated_at=now,
+            change_seq=change_seq
+        )
+        .returning(models.Task)
+        .execution_options(populate_existing=True)
+    )
     if db_task is None:
+        # Версия списка не должна меняться, если задача не изменена
+        await db.rollback()
         return None
 
-    db_task.title = task.title
-    db_task.description = task.description
-    db_task.status = task.status
-    db_task.priority = task.priority
-    db_task.deadline = task.deadline
-
-    db.commit()
-    db.refresh(db_task)
+    await db.commit()
+    title_index.add(user_id, change_seq, db_task.id, db_task.title)
+    task_card_cache.pop(db_task.id)
+    deadline_scheduler.schedule(db_task.id, user_id, db_task.deadline, task_to_dict(db_task))
+    _on_tasks_changed(user_id)
     return db_task
 
 
-def delete_task(db: Session, task_id: int):
+async def delete_task(db: AsyncSession, task_id: int, user_id: int) -> bool:
     """
-    Удаляет задачу по её идентификатору.
+    Удаляет задачу пользователя по её идентификатору.
+
+    Принадлежность проверяется в том же запросе `DELETE ... WHERE id AND owner_id RETURNING id`.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         task_id (int): Идентификатор задачи.
+        user_id (int): Идентификатор владельца задачи.
+
+    Returns:
+        bool: True, если задача удалена; False, если она не найдена или не принадлежит пользователю.
+    """
+    now = utcnow()
+    change_seq = await _bump_tasks_version(db, user_id, now)
+    deleted_id = await db.scalar(
+        delete(models.Task)
+        .where(models.Task.id == task_id, models.Task.owner_id == user_id)
+        .returning(models.Task.id)
+    )
+    if deleted_id is None:
+        await db.rollback()
+        return False
+
+    db.add(models.TaskTombstone(task_id=task_id, owner_id=user_id, change_seq=change_seq, deleted_at=now))
+    await db.commit()
+    title_index.remove(user_id, change_seq, task_id)
+    task_card_cache.pop(task_id)
+    deadline_scheduler.cancel(task_id)
+    _on_tasks_changed(user_id)
+    return True
+
+
+def task_value_error(task: schemas.TaskCreate) -> Optional[str]:
+    """
+    Проверяет статус и приоритет задачи по допустимым значениям столбцов таблицы задач.
+
+    Args:
+        task (schemas.TaskCreate): Данные задачи.
+
+    Returns:
+        Optional[str]: Описание ошибки или None, если значения допустимы.
+    """
+    if task.status not in models.TASK_STATUSES:
+        return f"status must be one of: {', '.join(models.TASK_STATUSES)}"
+    if task.priority not in models.TASK_PRIORITIES:
+        return f"priority must be one of: {', '.join(models.TASK_PRIORITIES)}"
+    return None
+
+
+async def apply_task_batch(db: AsyncSession, user_id: int, batch: schemas.TaskBatch) -> List[Dict[str, Any]]:
+    """
+    Выполняет пакет операций над задачами пользователя в одной транзакции.
+
+    Сначала блокируется строка пользователя (увеличение версии списка задач), затем
+    принадлежность всех обновляемых и удаляемых задач проверяется одним запросом с `IN`
+    (строки блокируются до конца транзакции). Задачи создаются одной многострочной вставкой
+    с `RETURNING`, обновляются одним пакетным UPDATE по первичному ключу и удаляются одним DELETE.
+    Операции над чужими или несуществующими задачами пропускаются со статусом "forbidden",
+    а создание и обновление с недопустимым статусом или приоритетом — со статусом "invalid".
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        batch (schemas.TaskBatch): Пакет операций.
+
+    Returns:
+        List[Dict[str, Any]]: Результаты операций в порядке запроса (см. `schemas.TaskBatchItemResult`).
+    """
+    now = utcnow()
+    results: List[Dict[str, Any]] = []
+    requested_ids = {item.id for item in batch.update} | set(batch.delete)
+    # Строка пользователя блокируется первой, как в `update_task` и `delete_task`,
+    # чтобы параллельные изменения задач одного пользователя не взаимоблокировались
+    change_seq = 0
+    if batch.create or requested_ids:
+        change_seq = await _bump_tasks_version(db, user_id, now)
+    owned_ids = set()
+    if requested_ids:
+        owned_ids = set(await db.scalars(
+            select(models.Task.id)
+            .where(models.Task.id.in_(requested_ids), models.Task.owner_id == user_id)
+            .with_for_update()
+        ))
+
+    valid_creates: List[Tuple[int, schemas.TaskCreate]] = []
+    for index, task in enumerate(batch.create):
+        error = task_value_error(task)
+        if error is not None:
+            results.append({"op": "create", "index": index, "id": None, "status": "invalid", "error": error, "task": None})
+        else:
+            valid_creates.append((index, task))
+
+    created: List[models.Task] = []
+    if valid_creates:
+        rows = [
+            {
+                **task.dict(),
+                "deadline": _to_naive_utc(task.deadline),
+                "owner_id": user_id,
+                "updated_at": now,
+                "change_seq": change_seq
+            }
+            for _, task in valid_creates
+        ]
+        created = list(await db.scalars(
+            insert(models.Task).returning(models.Task, sort_by_parameter_order=True),
+            rows
+        ))
+    for (index, _), db_task in zip(valid_creates, created):
+        results.append({"op": "create", "index": index, "id": db_task.id, "status": "ok", "task": db_task})
+    results.sort(key=lambda result: result["index"])
+
+    updated: List[models.Task] = []
+    for index, item in enumerate(batch.update):
+        error = task_value_error(item)
+        if error is not None:
+            results.append({"op": "update", "index": index, "id": item.id, "status": "invalid", "error": error, "task": None})
+            continue
+        if item.id not in owned_ids:
+            results.append({"op": "update", "index": index, "id": item.id, "status": "forbidden", "task": None})
+            continue
+        db_task = models.Task(**item.dict(), owner_id=user_id, updated_at=now, change_seq=change_seq)
+        db_task.deadline = _to_naive_utc(db_task.deadline)
+        updated.append(db_task)
+        results.append({"op": "update", "index": index, "id": item.id, "status": "ok", "task": db_task})
+    if updated:
+        await db.execute(update(models.Task), [
+            {
+                "id": task.id,
+                "title": task.title,
+                "description": task.description,
+                "status": task.status,
+                "priority": task.priority,
+                "deadline": task.deadline,
+                "updated_at": now,
+                "change_seq": change_seq
+            }
+            for task in updated
+        ])
+        await db.execute(
+            update(models.Task)
+            .where(models.Task.id.in_([task.id for task in updated]))
+            .values(version=models.Task.version + 1)
+        )
+
+    deleted_ids = [task_id for task_id in batch.delete if task_id in owned_ids]
+    for index, task_id in enumerate(batch.delete):
+        results.append({
+            "op": "delete",
+            "index": index,
+            "id": task_id,
+            "status": "ok" if task_id in owned_ids else "forbidden",
+            "task": None
+        })
+    if deleted_ids:
+        await db.execute(delete(models.Task).where(models.Task.id.in_(deleted_ids)))
+        await db.execute(insert(models.TaskTombstone), [
+            {"task_id": task_id, "owner_id": user_id, "change_seq": change_seq, "deleted_at": now}
+            for task_id in dict.fromkeys(deleted_ids)
+        ])
+
+    if created or updated or deleted_ids:
+        await db.commit()
+    else:
+        # Версия списка не должна меняться, если ни одна операция не выполнена
+        await db.rollback()
+
+    for db_task in created + updated:
+        title_index.add(user_id, change_seq, db_task.id, db_task.title)
+        deadline_scheduler.schedule(db_task.id, user_id, db_task.deadline, task_to_dict(db_task))
+    for db_task in updated:
+        task_card_cache.pop(db_task.id)
+    for task_id in deleted_ids:
+        title_index.remove(user_id, change_seq, task_id)
+        task_card_cache.pop(task_id)
+        deadline_scheduler.cancel(task_id)
+    if created or updated or deleted_ids:
+        _on_tasks_changed(user_id)
+    return results
+
+
+async def bulk_insert_tasks(db: AsyncSession, user_id: int, tasks: List[schemas.TaskCreate]) -> int:
+    """
+    Вставляет пачку задач пользователя одной операцией и фиксирует транзакцию.
+
+    В PostgreSQL строки загружаются командой COPY (`copy_records_to_table` драйвера asyncpg),
+    в остальных базах данных — многострочным INSERT.
+
+    Поисковый индекс, планировщик сроков и кэши не обновляются для каждой пачки:
+    после загрузки всех пачек нужно вызвать `refresh_task_state`.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        tasks (List[schemas.TaskCreate]): Проверенные данные задач.
+
+    Returns:
+        int: Количество вставленных задач.
+
+    Raises:
+        SQLAlchemyError: Если база данных отклонила пачку (в том числе ошибка COPY).
+    """
+    now = utcnow()
+    change_seq = await _bump_tasks_version(db, user_id, now)
+    columns = [
+        "title", "description", "status", "priority", "deadline", "owner_id", "version", "updated_at", "change_seq"
+    ]
+    records = [
+        (
+            task.title, task.description, task.status, task.priority, _to_naive_utc(task.deadline),
+            user_id, 1, now, change_seq
+        )
+        for task in tasks
+    ]
+    if db.get_bind().dialect.name == "postgresql":
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(
+                models.Task.__tablename__,
+                records=records,
+                columns=columns
+            )
+        except asyncpg.PostgresError as error:
+            # COPY выполняется в обход SQLAlchemy, поэтому ошибка драйвера оборачивается вручную
+            raise DatabaseError(f"COPY {models.Task.__tablename__}", None, error) from error
+    else:
+        await db.execute(insert(models.Task), [dict(zip(columns, record)) for record in records])
+    await db.commit()
+    return len(records)
+
+
+async def refresh_task_state(db: AsyncSession, user_id: int) -> None:
     """
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
-    if task:
-        db.delete(task)
-        db.commit()
+    Обновляет поисковый индекс, планировщик сроков и кэши после массовой загрузки задач пользователя.
 
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+    """
+    title_index.invalidate(user_id)
+    for task in await get_tasks_with_upcoming_deadline(db, user_id=user_id):
+        deadline_scheduler.schedule(task.id, user_id, task.deadline, task_to_dict(task))
+    _on_tasks_changed(user_id)
 
-def create_session(db: Session, user_id: int) -> models.Session:
+
+async def create_session(db: AsyncSession, user_id: int) -> models.Session:
     """
     Создает новую сессию для пользователя.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
 
     Returns:
         models.Session: Созданный объект сессии.
     """
     session_token = secrets.token_hex(32)
-    expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+    expires_at = utcnow() + timedelta(days=7)
     db_session = models.Session(user_id=user_id, session_token=session_token, expires_at=expires_at)
     db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
+    await db.commit()
     return db_session
 
 
-def get_session(db: Session, session_token: str) -> Optional[models.Session]:
+async def get_session(db: AsyncSession, session_token: str) -> Optional[models.Session]:
     """
     Получает сессию по её токену.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         session_token (str): Токен сессии.
 
     Returns:
         Optional[models.Session]: Объект сессии, если найден, иначе None.
     """
-    return db.query(models.Session).filter(models.Session.session_token == session_token).first()
+    return await db.scalar(select(models.Session).where(models.Session.session_token == session_token))
+
+
+async def get_active_session(db: AsyncSession, session_token: str) -> Optional[models.Session]:
+    """
+    Получает действительную сессию по её токену вместе с пользователем одним запросом.
+
+    Пользователь загружается через JOIN с таблицей `users`, а срок действия проверяется в SQL,
+    поэтому истекшие сессии не загружаются из базы данных.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        session_token (str): Токен сессии.
+
+    Returns:
+        Optional[models.Session]: Объект сессии с загруженным `user`, если сессия найдена и не истекла, иначе None.
+    """
+    return await db.scalar(
+        select(models.Session)
+        .options(joinedload(models.Session.user, innerjoin=True))
+        .where(
+            models.Session.session_token == session_token,
+            models.Session.expires_at >= utcnow()
+        )
+    )
 
 
-def delete_session(db: Session, session_token: str):
+async def delete_session(db: AsyncSession, session_token: str):
     """
     Удаляет сессию по её токену.
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         session_token (str): Токен сессии.
     """
-    db.query(models.Session).filter(models.Session.session_token == session_token).delete()
-    db.commit()
+    await db.execute(delete(models.Session).where(models.Session.session_token == session_token))
+    await db.commit()
+    session_cache.pop(session_token)
+
+
+async def delete_expired_sessions(db: AsyncSession, batch_size: int) -> int:
+    """
+    Удаляет одну пачку истекших сессий.
+
+    За один вызов удаляется не более `batch_size` строк, чтобы не держать
+    долгие блокировки на таблице `sessions`.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        batch_size (int): Максимальное количество удаляемых сессий.
+
+    Returns:
+        int: Количество удаленных сессий.
+    """
+    expired_ids = (
+        select(models.Session.id)
+        .where(models.Session.expires_at < utcnow())
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(models.Session)
+        .where(models.Session.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
 
 
 def task_to_dict(task: models.Task) -> dict:
@@ -238,45 +817,169 @@ def task_to_dict(task: models.Task) -> dict:
     }
 
 
-def get_tasks_with_near_deadline(db: Session, user_id: int) -> List[dict]:
+async def get_tasks_with_near_deadline(db: AsyncSession, user_id: int) -> List[dict]:
     """
     Получает список задач пользователя, у которых срок выполнения истекает в течение суток.
 
+    Результат кэшируется в `near_deadline_cache`. Из базы загружаются задачи в окне, которое
+    на `NEAR_DEADLINE_CACHE_SLACK` секунд шире суток, и запись живет столько же, поэтому
+    при смещении окна во времени ответ строится из кэша без повторного запроса.
+    Кэш сбрасывается при изменении задач пользователя.
+
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
 
     Returns:
-        List[dict]: Список задач в виде словарей.
+        List[dict]: Список задач в виде словарей, упорядоченный по сроку выполнения.
     """
-    one_day_from_now = datetime.now(timezone.utc) + timedelta(days=1)
-    tasks = db.query(models.Task).filter(
-        models.Task.owner_id == user_id,
-        models.Task.deadline <= one_day_from_now,
-        models.Task.deadline > datetime.now(timezone.utc)
-    ).all()
-    return [task_to_dict(task) for task in tasks]
+    now = utcnow()
+    horizon = now + timedelta(days=1)
+    entry: Optional[NearDeadlineEntry] = near_deadline_cache.get(user_id)
+
+    if entry is None or entry.window_end < horizon:
+        window_end = horizon + timedelta(seconds=NEAR_DEADLINE_CACHE_SLACK)
+        tasks = await db.scalars(select(models.Task).where(
+            models.Task.owner_id == user_id,
+            models.Task.deadline <= window_end,
+            models.Task.deadline > now
+        ).order_by(models.Task.deadline))
+        entry = NearDeadlineEntry(
+            window_end=window_end,
+            tasks=tuple((task.deadline, task_to_dict(task)) for task in tasks)
+        )
+        near_deadline_cache.set(user_id, entry)
+
+    return [task for deadline, task in entry.tasks if now < deadline <= horizon]
+
+
+async def get_tasks_with_upcoming_deadline(db: AsyncSession, user_id: Optional[int] = None) -> List[models.Task]:
+    """
+    Получает задачи, срок выполнения которых еще не наступил.
 
+    Используется для загрузки планировщика сроков `deadline_scheduler`.
 
-def search_tasks(db: Session, user_id: int, query: str, threshold: int = 5) -> List[models.Task]:
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (Optional[int]): Идентификатор пользователя. По умолчанию None — задачи всех пользователей.
+
+    Returns:
+        List[models.Task]: Список задач, упорядоченный по сроку выполнения.
     """
-    Ищет задачи пользователя по заголовку с использованием алгоритма Левенштейна.
+    query = select(models.Task).where(models.Task.deadline > utcnow())
+    if user_id is not None:
+        query = query.where(models.Task.owner_id == user_id)
+    tasks = await db.scalars(query.order_by(models.Task.deadline))
+    return list(tasks)
+
+
+async def search_tasks(
+    db: AsyncSession,
+    user_id: int,
+    query: str,
+    threshold: int = 5,
+    limit: Optional[int] = SEARCH_LIMIT
+) -> List[models.Task]:
+    """
+    Ищет задачи пользователя по заголовку.
+
+    Бэкенд поиска выбирается настройкой `SEARCH_BACKEND`. Для "pg_trgm" ранжирование по триграммному
+    сходству выполняется в PostgreSQL, и из базы возвращаются только первые `limit` совпадений.
+    Для остальных СУБД и по умолчанию используется алгоритм Левенштейна (`search_tasks_levenshtein`).
 
     Args:
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         user_id (int): Идентификатор пользователя.
         query (str): Поисковый запрос.
         threshold (int): Максимальное расстояние Левенштейна для совпадения. По умолчанию 5.
+        limit (Optional[int]): Максимальное количество задач в результате. По умолчанию `SEARCH_LIMIT`;
+            None — без ограничения.
+
+    Returns:
+        List[models.Task]: Список задач, соответствующих запросу, от наиболее похожих к наименее.
+    """
+    if SEARCH_BACKEND == "pg_trgm" and db.get_bind().dialect.name == "postgresql":
+        return await search_tasks_trgm(db, user_id, query, limit)
+    return await search_tasks_levenshtein(db, user_id, query, threshold, limit)
+
+
+async def search_tasks_trgm(
+    db: AsyncSession,
+    user_id: int,
+    query: str,
+    limit: Optional[int] = SEARCH_LIMIT
+) -> List[models.Task]:
+    """
+    Ищет задачи пользователя по заголовку с помощью расширения PostgreSQL pg_trgm.
+
+    Отбор выполняется оператором `%` по GIN-индексу `ix_tasks_title_trgm` с порогом
+    `SEARCH_TRGM_THRESHOLD`, результаты упорядочиваются по убыванию `similarity`.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        query (str): Поисковый запрос.
+        limit (Optional[int]): Максимальное количество задач в результате. По умолчанию `SEARCH_LIMIT`;
+            None — без ограничения.
 
     Returns:
         List[models.Task]: Список задач, соответствующих запросу.
     """
-    tasks = db.query(models.Task).filter(models.Task.owner_id == user_id).all()
-    similar_tasks: List[Tuple[models.Task, int]] = []
+    # Порог действует только до конца текущей транзакции
+    await db.execute(select(func.set_config("pg_trgm.similarity_threshold", str(SEARCH_TRGM_THRESHOLD), True)))
+    tasks = await db.scalars(select(models.Task).where(
+        models.Task.owner_id == user_id,
+        models.Task.title.op("%")(query)
+    ).order_by(
+        func.similarity(models.Task.title, query).desc(),
+        models.Task.id
+    ).limit(limit))
+    return list(tasks)
+
+
+async def search_tasks_levenshtein(
+    db: AsyncSession,
+    user_id: int,
+    query: str,
+    threshold: int = 5,
+    limit: Optional[int] = SEARCH_LIMIT
+) -> List[models.Task]:
+    """
+    Ищет задачи пользователя по заголовку с использованием алгоритма Левенштейна.
+
+    Поиск выполняется по BK-дереву заголовков пользователя, которое строится при первом запросе
+    и затем поддерживается функциями `create_task`, `update_task` и `delete_task`. Если версия
+    списка задач в базе данных не совпадает с версией индекса (задачи изменил другой воркер),
+    индекс строится заново.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        query (str): Поисковый запрос.
+        threshold (int): Максимальное расстояние Левенштейна для совпадения. По умолчанию 5.
+        limit (Optional[int]): Максимальное количество задач в результате. По умолчанию `SEARCH_LIMIT`;
+            None — без ограничения.
 
-    for task in tasks:
-        distance = levenshtein_distance(query.lower(), task.title.lower())
-        if distance <= threshold:
-            similar_tasks.append((task, distance))
-    similar_tasks.sort(key=lambda x: x[1])
-    return [task[0] for task in similar_tasks]
\ No newline at end of file
+    Returns:
+        List[models.Task]: Список задач, соответствующих запросу, упорядоченный по расстоянию.
+    """
+    # Версия читается до заголовков: если задачи изменятся между запросами,
+    # индекс получит старую версию и будет перестроен при следующем поиске
+    version, _ = await get_tasks_version(db, user_id)
+    index = title_index.get(user_id, version)
+    if index is None:
+        rows = await db.execute(
+            select(models.Task.id, models.Task.title).where(models.Task.owner_id == user_id)
+        )
+        index = title_index.build(user_id, version, rows.all())
+
+    matches: List[Tuple[int, int]] = index.search(query, threshold)[:limit]
+    if not matches:
+        return []
+
+    tasks = await db.scalars(select(models.Task).where(
+        models.Task.owner_id == user_id,
+        models.Task.id.in_([task_id for task_id, _ in matches])
+    ))
+    tasks_by_id = {task.id: task for task in tasks}
+    return [tasks_by_id[task_id] for task_id, _ in matches if task_id in tasks_by_id]
@@ -1,31 +1,86 @@
 """
-Модуль для настройки подключения к базе данных PostgreSQL с использованием SQLAlchemy.
+Модуль для настройки асинхронного подключения к базе данных PostgreSQL с использованием SQLAlchemy.
 
-Этот модуль создает движок базы данных, фабрику сессий и базовый класс для объявления моделей ORM.
+Этот модуль создает асинхронный движок базы данных (драйвер asyncpg) с настраиваемым пулом соединений,
+фабрику асинхронных сессий и базовый класс для объявления моделей ORM.
 """
 
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .configs.configs import (
+    DB_HOST,
+    DB_LOGIN,
+    DB_MAX_OVERFLOW,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PORT,
+    DB_STATEMENT_TIMEOUT,
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, который дополнительно считает запросы, ожидающие свободное соединение.
+
+    Атрибуты:
+        waiting (int): Количество запросов, ожидающих соединение в данный момент.
+    """
 
-from .configs.configs import DB_HOST, DB_LOGIN, DB_PASSWORD, DB_NAME, DB_PORT
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waiting: int = 0
 
+    def _do_get(self) -> Any:
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            self.waiting -= 1
 
-# Строка подключения к базе данных PostgreSQL
-SQLALCHEMY_DATABASE_URL: str = f"postgresql://{DB_LOGIN}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# Создание движка базы данных
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Строка подключения к базе данных PostgreSQL через асинхронный драйвер asyncpg
+SQLALCHEMY_DATABASE_URL: str = f"postgresql+asyncpg://{DB_LOGIN}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Создание асинхронного движка базы данных
+engine: AsyncEngine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args={"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT)}}
+)
 """
-Движок базы данных, который используется для взаимодействия с PostgreSQL.
+Асинхронный движок базы данных, который используется для взаимодействия с PostgreSQL.
+Запросы не блокируют цикл событий, а количество параллельных запросов ограничено размером пула соединений.
+- `pool_size`, `max_overflow`: Постоянные и дополнительные соединения пула (`DB_POOL_SIZE`, `DB_MAX_OVERFLOW`).
+- `pool_timeout`: Сколько секунд ждать свободное соединение (`DB_POOL_TIMEOUT`).
+- `pool_recycle`: Через сколько секунд пересоздавать соединение (`DB_POOL_RECYCLE`, -1 - никогда).
+- `pool_pre_ping`: Проверять соединение перед выдачей из пула (`DB_POOL_PRE_PING`).
+- `statement_timeout`: Ограничение времени запроса на стороне PostgreSQL (`DB_STATEMENT_TIMEOUT`, мс).
 """
 
-# Создание фабрики сессий
-SessionLocal: sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Создание фабрики асинхронных сессий
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=engine,
+    autoflush=False,
+    expire_on_commit=False
+)
 """
-Фабрика сессий для создания объектов сессий SQLAlchemy.
-- `autocommit=False`: Отключает автоматическую фиксацию изменений.
+Фабрика асинхронных сессий SQLAlchemy.
 - `autoflush=False`: Отключает автоматическую выгрузку данных в базу.
+- `expire_on_commit=False`: Атрибуты объектов остаются доступны после фиксации без повторной загрузки,
+  что необходимо для асинхронных сессий, где неявная ленивая загрузка невозможна.
 - `bind=engine`: Привязка сессии к созданному движку базы данных.
 """
 
@@ -35,3 +90,26 @@ Base = declarative_base()
 Базовый класс, от которого наследуются все модели ORM.
 Используется для объявления таблиц и схемы базы данных.
 """
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Возвращает состояние пула соединений текущего процесса.
+
+    Returns:
+        Dict[str, Any]: Размер пула, количество выданных, свободных и дополнительных соединений,
+        количество ожидающих запросов и настроенный лимит. Для пулов без очереди
+        (например, NullPool) возвращается только имя класса пула.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__}
+    return {
+        "pool_class": type(pool).__name__,
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "waiting": getattr(pool, "waiting", 0),
+        "max_connections": pool.size() + DB_MAX_OVERFLOW,
+    }
@@ -5,35 +5,32 @@
 основываясь на токене сессии, переданном через cookie.
 """
 
-from datetime import datetime
-from typing import Generator, Optional
+from typing import AsyncGenerator, Optional
 
 from fastapi import Depends, Cookie
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import crud, models
-from .database import SessionLocal
+from .cache import SessionEntry, session_cache
+from .database import AsyncSessionLocal
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Генератор для получения сессии базы данных.
+    Асинхронный генератор для получения сессии базы данных.
 
-    Эта функция создает и возвращает сессию базы данных, которая автоматически закрывается после использования.
+    Эта функция создает и возвращает асинхронную сессию базы данных, которая автоматически закрывается после использования.
 
     Yields:
-        Session: Объект сессии базы данных.
+        AsyncSession: Объект сессии базы данных.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(
+async def get_current_user(
     session_token: Optional[str] = Cookie(None),  # Токен сессии из cookie
-    db: Session = Depends(get_db)  # Сессия базы данных
+    db: AsyncSession = Depends(get_db)  # Сессия базы данных
 ) -> Optional[models.User]:
     """
     Получает текущего пользователя на основе токена сессии.
@@ -44,7 +41,7 @@ def get_current_user(
 
     Args:
         session_token (Optional[str]): Токен сессии, переданный через cookie. По умолчанию None.
-        db (Session): Сессия базы данных, полученная через зависимость `get_db`.
+        db (AsyncSession): Сессия базы данных, полученная через зависимость `get_db`.
 
     Returns:
         Optional[models.User]: Объект пользователя, если сессия действительна, иначе None.
@@ -52,12 +49,44 @@ def get_current_user(
     if session_token is None:
         return None
 
-    # Получаем сессию по токену
-    session: Optional[models.Session] = crud.get_session(db, session_token)
+    return await resolve_session_user(db, session_token)
 
-    # Проверяем, что сессия существует и не истек срок её действия
-    if session is None or session.expires_at < datetime.utcnow():
+
+async def resolve_session_user(db: AsyncSession, session_token: str) -> Optional[models.User]:
+    """
+    Возвращает пользователя по токену сессии, используя кэш `session_cache`.
+
+    При попадании в кэш запросы к базе данных не выполняются. Запись кэша живет не дольше
+    `SESSION_CACHE_TTL` секунд и не дольше самой сессии. Возвращаемый объект пользователя
+    не привязан к сессии базы данных и содержит только столбцы таблицы `users`.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        session_token (str): Токен сессии.
+
+    Returns:
+        Optional[models.User]: Объект пользователя, если сессия действительна, иначе None.
+    """
+    now = crud.utcnow()
+    entry: Optional[SessionEntry] = session_cache.get(session_token)
+
+    if entry is None:
+        # Получаем действительную сессию вместе с пользователем одним запросом
+        session: Optional[models.Session] = await crud.get_active_session(db, session_token)
+        if session is None:
+            return None
+
+        user: models.User = session.user
+        entry = SessionEntry(
+            user_id=user.id,
+            username=user.username,
+            hashed_password=user.hashed_password,
+            expires_at=session.expires_at
+        )
+        ttl = max(0.0, min(session_cache.ttl, (session.expires_at - now).total_seconds()))
+        session_cache.set(session_token, entry, ttl=ttl)
+    elif entry.expires_at < now:
+        session_cache.pop(session_token)
         return None
 
-    # Возвращаем пользователя, связанного с сессией
-    return session.user
+    return models.User(id=entry.user_id, username=entry.username, hashed_password=entry.hashed_password)
@@ -0,0 +1,108 @@
+"""
+Модуль для условных HTTP-запросов (ETag, If-None-Match, Last-Modified, If-Modified-Since).
+
+Этот модуль предоставляет функции, которые формируют заголовки валидации кэша по версии ресурса
+и проверяют условные заголовки запроса, чтобы ответить 304 Not Modified без формирования тела ответа.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Формирует строгий ETag из частей версии ресурса.
+
+    Args:
+        *parts (object): Части версии (например, тип ресурса, идентификатор пользователя и версия).
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def query_digest(*params: object) -> str:
+    """
+    Формирует короткий отпечаток параметров запроса для ETag.
+
+    Значения параметров (например, фильтры с кириллицей) нельзя передать в заголовке как есть,
+    поэтому в ETag добавляется их хэш.
+
+    Args:
+        *params (object): Нормализованные параметры запроса (None для отсутствующих).
+
+    Returns:
+        str: Первые 16 символов шестнадцатеричного SHA-256 параметров.
+    """
+    return hashlib.sha256(repr(params).encode()).hexdigest()[:16]
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """
+    Формирует заголовки валидации кэша.
+
+    Ответы зависят от пользователя (cookie сессии), поэтому разрешено только кэширование
+    в браузере с обязательной проверкой актуальности.
+
+    Args:
+        etag (str): ETag ресурса.
+        last_modified (Optional[datetime]): Время последнего изменения ресурса (UTC) или None.
+
+    Returns:
+        Dict[str, str]: Заголовки ответа.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Cookie"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Проверяет, актуальна ли копия ресурса у клиента.
+
+    Если передан If-None-Match, решение принимается только по нему; If-Modified-Since
+    учитывается с точностью до секунды, как в заголовке Last-Modified.
+
+    Args:
+        request (Request): Объект запроса.
+        etag (str): Текущий ETag ресурса.
+        last_modified (Optional[datetime]): Время последнего изменения ресурса (UTC) или None.
+
+    Returns:
+        bool: True, если можно ответить 304 Not Modified.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= since
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """
+    Формирует ответ 304 Not Modified без тела.
+
+    Args:
+        etag (str): ETag ресурса.
+        last_modified (Optional[datetime]): Время последнего изменения ресурса (UTC) или None.
+
+    Returns:
+        Response: Ответ 304 с заголовками валидации кэша.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, last_modified))
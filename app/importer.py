@@ -0,0 +1,405 @@
+"""
+Модуль для массового импорта задач из файлов CSV и NDJSON.
+
+Файл читается потоком: строки разбираются по мере поступления, проверяются моделью
+`schemas.TaskCreate` и загружаются пачками по `IMPORT_CHUNK_SIZE` (в PostgreSQL — командой COPY).
+Ошибочные строки пропускаются и попадают в отчет, не прерывая импорт остальных строк.
+
+Импорт доступен через API (`POST /api/tasks/import`) и из командной строки:
+
+    python -m app.importer --username user1 tasks.csv
+"""
+
+import argparse
+import asyncio
+import csv
+from collections import deque
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Dict, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import crud, schemas
+from .configs.configs import IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
+from .database import AsyncSessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+# Поддерживаемые форматы файла импорта
+IMPORT_FORMATS: Tuple[str, ...] = ("ndjson", "csv")
+
+# Необязательные поля, пустое значение которых в CSV означает значение по умолчанию
+OPTIONAL_FIELDS: Tuple[str, ...] = ("status", "priority", "deadline")
+
+
+@dataclass
+class ImportReport:
+    """
+    Результат импорта задач.
+
+    Атрибуты:
+        imported (int): Количество загруженных задач.
+        failed (int): Количество строк, которые не удалось загрузить.
+        errors (List[Dict[str, Any]]): Ошибки строк (номер строки и описание),
+            не более `IMPORT_MAX_ERRORS` первых ошибок.
+    """
+    imported: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, row: int, error: str) -> None:
+        """
+        Регистрирует ошибку строки.
+
+        Args:
+            row (int): Номер строки файла (начиная с 1).
+            error (str): Описание ошибки.
+        """
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes], report: ImportReport) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Разбивает поток байтов на строки.
+
+    Разбиение выполняется до декодирования: байт перевода строки не встречается внутри
+    многобайтовых символов UTF-8, поэтому символ, разрезанный границей блока, не повреждается.
+    Строки, которые не являются корректным UTF-8, пропускаются и попадают в отчет.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Блоки файла.
+        report (ImportReport): Отчет, в который записываются ошибки декодирования.
+
+    Yields:
+        Tuple[int, str]: Номер строки (начиная с 1) и строка вместе с переводом строки.
+    """
+    line_number = 0
+    tail = b""
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            line_number += 1
+            try:
+                yield line_number, line.decode("utf-8-sig" if line_number == 1 else "utf-8") + "\n"
+            except UnicodeDecodeError as error:
+                report.add_error(line_number, f"Invalid UTF-8: {error}")
+    if tail:
+        line_number += 1
+        try:
+            yield line_number, tail.decode("utf-8-sig" if line_number == 1 else "utf-8")
+        except UnicodeDecodeError as error:
+            report.add_error(line_number, f"Invalid UTF-8: {error}")
+
+
+async def _iter_ndjson(chunks: AsyncIterable[bytes], report: ImportReport) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Разбирает файл NDJSON (один JSON-объект в строке). Пустые строки пропускаются.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Блоки файла.
+        report (ImportReport): Отчет, в который записываются ошибки разбора.
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: Номер строки и данные задачи.
+    """
+    async for line_number, line in _iter_lines(chunks, report):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            report.add_error(line_number, f"Invalid JSON: {error}")
+            continue
+        if not isinstance(row, dict):
+            report.add_error(line_number, "Expected a JSON object")
+            continue
+        yield line_number, row
+
+
+class _NeedMoreLines(Exception):
+    """
+    Сигнал `_CsvLineFeed`: строки закончились раньше, чем `csv.reader` дочитал запись.
+    """
+
+
+class _CsvLineFeed:
+    """
+    Источник строк для `csv.reader`, который наполняется по мере чтения файла.
+
+    `csv.reader` читает строки синхронно, а файл поступает асинхронно. Если поступившие строки
+    закончились посреди записи (поле в кавычках с переводом строки), `__next__` прерывает разбор
+    исключением `_NeedMoreLines`, а `rewind` возвращает строки начатой записи, чтобы разобрать её
+    заново после поступления следующей строки.
+
+    Атрибуты:
+        pending (Deque[Tuple[int, str]]): Поступившие, но еще не прочитанные строки с номерами.
+        taken (List[Tuple[int, str]]): Строки, прочитанные для текущей записи.
+        closed (bool): True, если файл прочитан полностью.
+    """
+
+    def __init__(self) -> None:
+        self.pending: Deque[Tuple[int, str]] = deque()
+        self.taken: List[Tuple[int, str]] = []
+        self.closed: bool = False
+
+    def __iter__(self) -> "_CsvLineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if not self.pending:
+            if self.closed:
+                raise StopIteration
+            raise _NeedMoreLines
+        item = self.pending.popleft()
+        self.taken.append(item)
+        return item[1]
+
+    def record_start(self) -> int:
+        """
+        Возвращает номер первой строки текущей записи.
+
+        Returns:
+            int: Номер строки или 0, если для записи еще не прочитано ни одной строки.
+        """
+        return self.taken[0][0] if self.taken else 0
+
+    def rewind(self) -> None:
+        """
+        Возвращает строки незавершенной записи в начало очереди.
+        """
+        self.pending.extendleft(reversed(self.taken))
+        self.taken = []
+
+    def commit(self) -> None:
+        """
+        Отмечает текущую запись как разобранную.
+        """
+        self.taken = []
+
+
+async def _iter_csv(chunks: AsyncIterable[bytes], report: ImportReport) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Разбирает файл CSV с заголовком. Пустые значения необязательных полей заменяются значениями по умолчанию.
+
+    Строки файла передаются в `csv.reader` через `_CsvLineFeed`, поэтому записи, в которых поле
+    в кавычках содержит перевод строки, разбираются по правилам CSV.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Блоки файла.
+        report (ImportReport): Отчет, в который записываются ошибки разбора.
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: Номер первой строки записи и данные задачи.
+    """
+    feed = _CsvLineFeed()
+    # strict: незакрытая кавычка в конце файла — ошибка, а не обрезанная запись
+    reader = csv.reader(feed, strict=True)
+    header: List[str] = []
+    lines = _iter_lines(chunks, report)
+    while True:
+        try:
+            feed.pending.append(await anext(lines))
+        except StopAsyncIteration:
+            feed.closed = True
+
+        while True:
+            try:
+                values = next(reader)
+            except _NeedMoreLines:
+                feed.rewind()
+                break
+            except StopIteration:
+                return
+            except csv.Error as error:
+                report.add_error(feed.record_start(), f"Invalid CSV: {error}")
+                feed.commit()
+                continue
+
+            record_start = feed.record_start()
+            feed.commit()
+            if not values:
+                continue
+            if not header:
+                header = [name.strip() for name in values]
+                continue
+            if len(values) != len(header):
+                report.add_error(record_start, f"Expected {len(header)} columns, got {len(values)}")
+                continue
+
+            row = dict(zip(header, values))
+            for name in OPTIONAL_FIELDS:
+                if row.get(name) == "":
+                    del row[name]
+            yield record_start, row
+
+
+def _validate(row: Dict[str, Any]) -> schemas.TaskCreate:
+    """
+    Проверяет данные задачи.
+
+    Args:
+        row (Dict[str, Any]): Данные задачи из файла.
+
+    Returns:
+        schemas.TaskCreate: Проверенные данные задачи.
+
+    Raises:
+        ValueError: Если данные не соответствуют `schemas.TaskCreate` или допустимым значениям статуса и приоритета.
+    """
+    task = schemas.TaskCreate(**row)
+    error = crud.task_value_error(task)
+    if error is not None:
+        raise ValueError(error)
+    return task
+
+
+async def _flush(db: AsyncSession, user_id: int, chunk: List[Tuple[int, schemas.TaskCreate]], report: ImportReport) -> None:
+    """
+    Загружает пачку проверенных задач.
+
+    Если база данных отклонила пачку, она делится пополам и половины загружаются отдельно,
+    пока не останутся отдельные строки: корректные строки загружаются, а в отчет попадает
+    только отклоненная строка с текстом ошибки базы данных.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        chunk (List[Tuple[int, schemas.TaskCreate]]): Номера строк и проверенные данные задач.
+        report (ImportReport): Отчет об импорте.
+    """
+    try:
+        report.imported += await crud.bulk_insert_tasks(db, user_id, [task for _, task in chunk])
+    except SQLAlchemyError as error:
+        await db.rollback()
+        if len(chunk) > 1:
+            logger.info("Import chunk of %d rows failed, retrying in halves: %s", len(chunk), error)
+            middle = len(chunk) // 2
+            await _flush(db, user_id, chunk[:middle], report)
+            await _flush(db, user_id, chunk[middle:], report)
+            return
+        line_number = chunk[0][0]
+        cause = getattr(error, "orig", None) or error
+        logger.warning("Import row %d rejected by the database: %s", line_number, cause)
+        report.add_error(line_number, f"Database rejected this row: {cause}")
+
+
+async def import_tasks(
+    db: AsyncSession,
+    user_id: int,
+    chunks: AsyncIterable[bytes],
+    format: str,
+    chunk_size: int = IMPORT_CHUNK_SIZE
+) -> ImportReport:
+    """
+    Импортирует задачи пользователя из потока CSV или NDJSON.
+
+    Каждая пачка из `chunk_size` проверенных строк загружается и фиксируется отдельно,
+    поэтому память не зависит от размера файла, а ошибка одной пачки не отменяет уже загруженные.
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        user_id (int): Идентификатор пользователя.
+        chunks (AsyncIterable[bytes]): Блоки файла.
+        format (str): Формат файла: "ndjson" или "csv".
+        chunk_size (int): Размер пачки загрузки. По умолчанию `IMPORT_CHUNK_SIZE`.
+
+    Returns:
+        ImportReport: Количество загруженных задач и ошибки строк.
+    """
+    report = ImportReport()
+    rows = _iter_csv(chunks, report) if format == "csv" else _iter_ndjson(chunks, report)
+    chunk: List[Tuple[int, schemas.TaskCreate]] = []
+    async for line_number, row in rows:
+        try:
+            chunk.append((line_number, _validate(row)))
+        except ValidationError as error:
+            report.add_error(line_number, "; ".join(
+                f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+            ))
+            continue
+        except (TypeError, ValueError) as error:
+            report.add_error(line_number, str(error))
+            continue
+        if len(chunk) >= chunk_size:
+            await _flush(db, user_id, chunk, report)
+            chunk = []
+    if chunk:
+        await _flush(db, user_id, chunk, report)
+
+    if report.imported:
+        await crud.refresh_task_state(db, user_id)
+    logger.info("Imported %d tasks for user %d, %d rows failed", report.imported, user_id, report.failed)
+    return report
+
+
+async def _read_file(path: str, block_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    """
+    Читает файл блоками.
+
+    Args:
+        path (str): Путь к файлу.
+        block_size (int): Размер блока в байтах.
+
+    Yields:
+        bytes: Блок файла.
+    """
+    with open(path, "rb") as file:
+        while block := file.read(block_size):
+            yield block
+
+
+async def _run_import(username: str, path: str, format: str, chunk_size: int) -> ImportReport:
+    """
+    Импортирует файл для пользователя и закрывает пул соединений.
+
+    Args:
+        username (str): Имя пользователя, которому принадлежат задачи.
+        path (str): Путь к файлу.
+        format (str): Формат файла.
+        chunk_size (int): Размер пачки загрузки.
+
+    Returns:
+        ImportReport: Отчет об импорте.
+
+    Raises:
+        SystemExit: Если пользователь не найден.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            user = await crud.get_user_by_username(db, username)
+            if user is None:
+                raise SystemExit(f"User {username!r} not found")
+            return await import_tasks(db, user.id, _read_file(path), format, chunk_size)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """
+    Точка входа командной строки: импортирует файл и печатает отчет.
+    """
+    parser = argparse.ArgumentParser(description="Импорт задач из файла CSV или NDJSON")
+    parser.add_argument("path", help="Путь к файлу")
+    parser.add_argument("--username", required=True, help="Имя пользователя, которому принадлежат задачи")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Формат файла (по умолчанию по расширению)")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Размер пачки загрузки")
+    args = parser.parse_args()
+
+    format = args.format or ("csv" if os.path.splitext(args.path)[1].lower() == ".csv" else "ndjson")
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(_run_import(args.username, args.path, format, args.chunk_size))
+    for error in report.errors:
+        print(f"row {error['row']}: {error['error']}")
+    print(f"Imported {report.imported} tasks, {report.failed} rows failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,51 +5,159 @@
 а также для отображения HTML-страниц с использованием шаблонов Jinja2.
 """
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+import json
+import logging
 import re
-from typing import Optional, List, Dict
+from typing import Any, AsyncIterator, Optional, List, Dict
 
 from fastapi import FastAPI, Request, Depends, HTTPException, status, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import crud, models, schemas
 from .database import engine
-from .auth import verify_password, get_password_hash
-from .api import api_router
+from .auth import HashingOverloadedError, get_password_hash_async, password_hasher, verify_password_async
+from .api import api_router, metrics_router
+from .cache import page_cache
+from .configs.configs import DEADLINE_RESYNC_INTERVAL, LOG_LEVEL, SESSION_REAPER_INTERVAL, SSE_KEEPALIVE_INTERVAL
 from .dependencies import get_current_user, get_db
+from .http_cache import cache_headers, is_not_modified, make_etag, not_modified_response
+from .maintenance import load_upcoming_deadlines, run_session_reaper
+from .notifications import deadline_notifier
+from .scheduler import deadline_scheduler
+from .templating import create_template_environment, precompile_templates
+
+# Настройка логирования приложения
+logging.basicConfig(level=LOG_LEVEL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Управляет жизненным циклом приложения.
+
+    При запуске создает таблицы в базе данных, компилирует шаблоны и запускает фоновые задачи
+    (очистку истекших сессий и планировщик сроков задач), при остановке завершает фоновые задачи и закрывает пул соединений.
+
+    Args:
+        app (FastAPI): Экземпляр приложения.
+    """
+    # Создание таблиц в базе данных
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+
+    # Компиляция шаблонов до первого запроса
+    precompile_templates(templates.env)
+
+    background_tasks: List[asyncio.Task] = []
+    if SESSION_REAPER_INTERVAL > 0:
+        background_tasks.append(asyncio.create_task(run_session_reaper(SESSION_REAPER_INTERVAL)))
+    background_tasks.append(asyncio.create_task(
+        deadline_scheduler.run(load_upcoming_deadlines, DEADLINE_RESYNC_INTERVAL)
+    ))
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await engine.dispose()
+    password_hasher.shutdown()
 
-# Создание таблиц в базе данных
-models.Base.metadata.create_all(bind=engine)
 
 # Инициализация приложения FastAPI
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Подключение API-маршрутов
 app.include_router(api_router, prefix="/api", tags=["tasks"])
+app.include_router(metrics_router, prefix="/api")
 
 # Подключение статических файлов
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Настройка шаблонов Jinja2
-templates = Jinja2Templates(directory="app/templates")
+# Настройка шаблонов Jinja2 (кэш байт-кода, предварительная компиляция при запуске)
+templates = Jinja2Templates(env=create_template_environment("app/templates"))
+
+# Сообщение, которое показывается, когда пул хэширования паролей перегружен
+OVERLOADED_MESSAGE: str = "Сервер перегружен, попробуйте еще раз через несколько секунд"
+
+
+def _page_key(request: Request) -> str:
+    """
+    Возвращает ключ страницы в кэше страниц: путь вместе со строкой запроса.
+    """
+    return f"{request.url.path}?{request.url.query}" if request.url.query else request.url.path
+
+
+def _cached_page(request: Request, user_id: int) -> Optional[Response]:
+    """
+    Возвращает страницу пользователя из кэша страниц без обращения к базе данных и шаблонам.
+
+    Args:
+        request (Request): Объект запроса.
+        user_id (int): Идентификатор пользователя.
+
+    Returns:
+        Optional[Response]: Сохраненная страница, ответ 304 (если у страницы есть ETag и копия
+        клиента актуальна) или None, если страницы нет в кэше.
+    """
+    entry = page_cache.get(user_id, _page_key(request))
+    if entry is None:
+        return None
+    if entry.etag is None:
+        return HTMLResponse(entry.body)
+    if is_not_modified(request, entry.etag, entry.last_modified):
+        return not_modified_response(entry.etag, entry.last_modified)
+    return HTMLResponse(entry.body, headers=cache_headers(entry.etag, entry.last_modified))
+
+
+def _cache_page(
+    request: Request,
+    user_id: int,
+    stamp: int,
+    response: HTMLResponse,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None
+) -> HTMLResponse:
+    """
+    Сохраняет отрендеренную страницу пользователя в кэше страниц.
+
+    Args:
+        request (Request): Объект запроса.
+        user_id (int): Идентификатор пользователя.
+        stamp (int): Версия данных пользователя, полученная до чтения данных страницы.
+        response (HTMLResponse): Отрендеренная страница.
+        etag (Optional[str]): ETag страницы. По умолчанию None.
+        last_modified (Optional[datetime]): Время последнего изменения страницы. По умолчанию None.
+
+    Returns:
+        HTMLResponse: Та же страница.
+    """
+    page_cache.set(user_id, _page_key(request), stamp, response.body, etag, last_modified)
+    return response
 
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(
     request: Request,  # Объект запроса
-    db: Session = Depends(get_db),  # Сессия базы данных
+    db: AsyncSession = Depends(get_db),  # Сессия базы данных
     current_user: Optional[models.User] = Depends(get_current_user)  # Текущий пользователь
 ) -> HTMLResponse:
     """
     Отображает главную страницу.
 
     Если пользователь не авторизован, отображает сообщение об ошибке.
+    Страница авторизованного пользователя берется из кэша страниц (`page_cache`).
 
     Args:
         request (Request): Объект запроса.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         current_user (Optional[models.User]): Текущий пользователь.
 
     Returns:
@@ -59,14 +167,21 @@ async def read_root(
 
     if not current_user:
         errors["auth"] = "Вы не авторизованы. Пожалуйста, войдите или зарегистрируйтесь."
+        return templates.TemplateResponse("index.html", {
+            "request": request,
+            "current_user": current_user,
+            "errors": errors
+        })
 
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id) if current_user else []
-    return templates.TemplateResponse("index.html", {
+    cached: Optional[Response] = _cached_page(request, current_user.id)
+    if cached is not None:
+        return cached
+    stamp: int = page_cache.stamp(current_user.id)
+    return _cache_page(request, current_user.id, stamp, templates.TemplateResponse("index.html", {
         "request": request,
         "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks,
         "errors": errors
-    })
+    }))
 
 
 @app.get("/login", response_class=HTMLResponse)
@@ -84,7 +199,7 @@ async def login_page(request: Request) -> HTMLResponse:
 
 
 @app.post("/login", response_class=HTMLResponse)
-async def login(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+async def login(request: Request, db: AsyncSession = Depends(get_db)) -> HTMLResponse:
     """
     Обрабатывает запрос на вход пользователя.
 
@@ -92,7 +207,7 @@ async def login(request: Request, db: Session = Depends(get_db)) -> HTMLResponse
 
     Args:
         request (Request): Объект запроса.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: HTML-страница с результатом входа или перенаправление на страницу задач.
@@ -102,9 +217,16 @@ async def login(request: Request, db: Session = Depends(get_db)) -> HTMLResponse
     password: str = form.get("password")
     errors: Dict[str, str] = {}
 
-    user: Optional[models.User] = crud.get_user_by_username(db, username=username)
-    if not user or not verify_password(password, user.hashed_password):
-        errors["login"] = "Неверное имя пользователя или пароль"
+    user: Optional[models.User] = await crud.get_user_by_username(db, username=username)
+    try:
+        if not user or not await verify_password_async(password, user.hashed_password):
+            errors["login"] = "Неверное имя пользователя или пароль"
+    except HashingOverloadedError:
+        return templates.TemplateResponse(
+            "login.html",
+            {"request": request, "errors": {"login": OVERLOADED_MESSAGE}},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
 
     if not username:
         errors["username"] = "Имя пользователя не может быть пустым"
@@ -114,14 +236,14 @@ async def login(request: Request, db: Session = Depends(get_db)) -> HTMLResponse
     if errors:
         return templates.TemplateResponse("login.html", {"request": request, "errors": errors})
 
-    session: models.Session = crud.create_session(db, user.id)
+    session: models.Session = await crud.create_session(db, user.id)
     response = RedirectResponse(url="/tasks", status_code=status.HTTP_302_FOUND)
     response.set_cookie(key="session_token", value=session.session_token, httponly=True)
     return response
 
 
 @app.get("/logout", response_class=HTMLResponse)
-async def logout(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+async def logout(request: Request, db: AsyncSession = Depends(get_db)) -> HTMLResponse:
     """
     Обрабатывает запрос на выход пользователя.
 
@@ -129,14 +251,14 @@ async def logout(request: Request, db: Session = Depends(get_db)) -> HTMLRespons
 
     Args:
         request (Request): Объект запроса.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: Перенаправление на главную страницу.
     """
     session_token: Optional[str] = request.cookies.get("session_token")
     if session_token:
-        crud.delete_session(db, session_token)
+        await crud.delete_session(db, session_token)
     response = RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
     response.delete_cookie("session_token")
     return response
@@ -157,7 +279,7 @@ async def register_page(request: Request) -> HTMLResponse:
 
 
 @app.post("/register", response_class=HTMLResponse)
-async def register(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+async def register(request: Request, db: AsyncSession = Depends(get_db)) -> HTMLResponse:
     """
     Обрабатывает запрос на регистрацию нового пользователя.
 
@@ -165,7 +287,7 @@ async def register(request: Request, db: Session = Depends(get_db)) -> HTMLRespo
 
     Args:
         request (Request): Объект запроса.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: HTML-страница с результатом регистрации или перенаправление на страницу входа.
@@ -175,7 +297,7 @@ async def register(request: Request, db: Session = Depends(get_db)) -> HTMLRespo
     password: str = form.get("password")
     errors: Dict[str, str] = {}
 
-    existing_user: Optional[models.User] = crud.get_user_by_username(db, username=username)
+    existing_user: Optional[models.User] = await crud.get_user_by_username(db, username=username)
     if existing_user:
         errors["username"] = "Имя пользователя уже занято"
 
@@ -198,9 +320,16 @@ async def register(request: Request, db: Session = Depends(get_db)) -> HTMLRespo
     if errors:
         return templates.TemplateResponse("register.html", {"request": request, "errors": errors})
 
-    hashed_password: str = get_password_hash(password)
+    try:
+        hashed_password: str = await get_password_hash_async(password)
+    except HashingOverloadedError:
+        return templates.TemplateResponse(
+            "register.html",
+            {"request": request, "errors": {"password": OVERLOADED_MESSAGE}},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
     user: schemas.UserCreate = schemas.UserCreate(username=username, password=hashed_password)
-    db_user: models.User = crud.create_user(db, user, hashed_password)
+    db_user: models.User = await crud.create_user(db, user, hashed_password)
 
     return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
@@ -209,7 +338,7 @@ async def register(request: Request, db: Session = Depends(get_db)) -> HTMLRespo
 async def update_password_page(
     request: Request,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Отображает страницу для обновления пароля.
@@ -217,18 +346,16 @@ async def update_password_page(
     Args:
         request (Request): Объект запроса.
         current_user (models.User): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: HTML-страница для обновления пароля.
     """
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id)
     return templates.TemplateResponse("update_password.html", {
         "request": request,
         "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks,
         "errors": {}
     })
 
@@ -237,7 +364,7 @@ async def update_password_page(
 async def update_password(
     request: Request,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Обрабатывает запрос на обновление пароля.
@@ -247,7 +374,7 @@ async def update_password(
     Args:
         request (Request): Объект запроса.
         current_user (models.User): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: Перенаправление на главную страницу.
@@ -261,20 +388,27 @@ async def update_password(
     confirm_password: str = form.get("confirm_password")
     errors: Dict[str, str] = {}
 
-    if not verify_password(old_password, current_user.hashed_password):
-        errors["old_password"] = "Неверный старый пароль"
+    try:
+        if not await verify_password_async(old_password, current_user.hashed_password):
+            errors["old_password"] = "Неверный старый пароль"
 
-    if new_password != confirm_password:
-        errors["confirm_password"] = "Новый пароль и подтверждение не совпадают"
+        if new_password != confirm_password:
+            errors["confirm_password"] = "Новый пароль и подтверждение не совпадают"
 
-    if errors:
+        if errors:
+            return templates.TemplateResponse(
+                "update_password.html",
+                {"request": request, "current_user": current_user, "errors": errors}
+            )
+
+        hashed_password: str = await get_password_hash_async(new_password)
+    except HashingOverloadedError:
         return templates.TemplateResponse(
             "update_password.html",
-            {"request": request, "current_user": current_user, "errors": errors}
+            {"request": request, "current_user": current_user, "errors": {"old_password": OVERLOADED_MESSAGE}},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
         )
-    
-    hashed_password: str = get_password_hash(new_password)
-    crud.update_user_password(db, current_user.id, hashed_password)
+    await crud.update_user_password(db, current_user.id, hashed_password)
 
     return RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
 
@@ -284,7 +418,7 @@ async def search_tasks_page(
     request: Request,
     query: Optional[str] = Query(None),
     current_user: Optional[models.User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Отображает страницу поиска задач.
@@ -293,7 +427,7 @@ async def search_tasks_page(
         request (Request): Объект запроса.
         query (Optional[str]): Поисковый запрос.
         current_user (Optional[models.User]): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: HTML-страница с результатами поиска.
@@ -308,10 +442,9 @@ async def search_tasks_page(
             "errors": errors
         })
 
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id)
-
     if query:
-        tasks: List[models.Task] = crud.search_tasks(db, user_id=current_user.id, query=query)
+        # Страница поиска показывает все совпадения: ограничение SEARCH_LIMIT действует только для API
+        tasks: List[models.Task] = await crud.search_tasks(db, user_id=current_user.id, query=query, limit=None)
     else:
         tasks: List[models.Task] = []
 
@@ -323,7 +456,6 @@ async def search_tasks_page(
         "tasks": tasks,
         "query": query,
         "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks,
         "errors": errors
     })
 
@@ -331,41 +463,84 @@ async def search_tasks_page(
 @app.get("/tasks", response_class=HTMLResponse)
 async def tasks_page(
     request: Request,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    priority: Optional[str] = Query(None),
+    deadline_from: Optional[str] = Query(None),
+    deadline_to: Optional[str] = Query(None),
     current_user: Optional[models.User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Отображает страницу со списком задач.
 
+    Задачи каждой колонки (статуса) фильтруются и упорядочиваются по приоритету в базе данных.
+    Отрендеренная страница сохраняется в кэше страниц (`page_cache`) до изменения задач пользователя.
+
     Args:
         request (Request): Объект запроса.
+        status_filter (Optional[str]): Показать только колонку с этим статусом (параметр `status`).
+        priority (Optional[str]): Фильтр по приоритету.
+        deadline_from (Optional[str]): Нижняя граница срока выполнения в формате ISO 8601.
+        deadline_to (Optional[str]): Верхняя граница срока выполнения в формате ISO 8601.
         current_user (Optional[models.User]): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: HTML-страница со списком задач.
     """
     if not current_user:
         return templates.TemplateResponse("tasks.html", {"request": request, "current_user": current_user})
-    else:
-        tasks: List[models.Task] = crud.get_tasks(db, user_id=current_user.id)
 
-        tasks.sort(key=lambda task: {"низкий": 3, "средний": 2, "высокий": 1}[task.priority])
-        near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id)
-        return templates.TemplateResponse(
-            "tasks.html", {
-                "request": request,
-                "tasks": tasks,
-                "current_user": current_user,
-                "near_deadline_tasks": near_deadline_tasks
-            }
+    cached: Optional[Response] = _cached_page(request, current_user.id)
+    if cached is not None:
+        return cached
+    stamp: int = page_cache.stamp(current_user.id)
+
+    errors: Dict[str, str] = {}
+    filters: Dict[str, str] = {
+        "status": status_filter if status_filter in models.TASK_STATUSES else "",
+        "priority": priority if priority in models.TASK_PRIORITIES else "",
+        "deadline_from": deadline_from or "",
+        "deadline_to": deadline_to or ""
+    }
+    try:
+        deadline_range = [datetime.fromisoformat(value) if value else None for value in (deadline_from, deadline_to)]
+    except ValueError:
+        errors["filter"] = "Неверный формат даты в фильтре по сроку."
+        deadline_range = [None, None]
+
+    columns: Dict[str, List[models.Task]] = {}
+    for task_status in models.TASK_STATUSES:
+        if filters["status"] and task_status != filters["status"]:
+            continue
+        columns[task_status] = await crud.get_tasks_by_status(
+            db,
+            user_id=current_user.id,
+            status=task_status,
+            priority=filters["priority"] or None,
+            deadline_from=deadline_range[0],
+            deadline_to=deadline_range[1]
         )
+    response = templates.TemplateResponse(
+        "tasks.html", {
+            "request": request,
+            "columns": columns,
+            "filters": filters,
+            "statuses": models.TASK_STATUSES,
+            "priorities": models.TASK_PRIORITIES,
+            "current_user": current_user,
+            "errors": errors
+        }
+    )
+    if errors:
+        return response
+    return _cache_page(request, current_user.id, stamp, response)
 
 
 @app.get("/tasks/create", response_class=HTMLResponse)
 async def create_task_page(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user)
 ) -> HTMLResponse:
     """
@@ -373,17 +548,15 @@ async def create_task_page(
 
     Args:
         request (Request): Объект запроса.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         current_user (Optional[models.User]): Текущий пользователь.
 
     Returns:
         HTMLResponse: HTML-страница для создания задачи.
     """
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id)
     return templates.TemplateResponse("create_task.html", {
         "request": request,
         "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks,
         "errors": {}
     })
 
@@ -392,7 +565,7 @@ async def create_task_page(
 async def create_task(
     request: Request,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Обрабатывает запрос на создание новой задачи.
@@ -402,7 +575,7 @@ async def create_task(
     Args:
         request (Request): Объект запроса.
         current_user (models.User): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: Перенаправление на страницу задач.
@@ -436,7 +609,7 @@ async def create_task(
         priority=form.get("priority"),
         deadline=deadline
     )
-    crud.create_task(db, task, user_id=current_user.id)
+    await crud.create_task(db, task, user_id=current_user.id)
     return RedirectResponse(url="/tasks", status_code=status.HTTP_302_FOUND)
 
 
@@ -444,7 +617,7 @@ async def create_task(
 async def edit_task_page(
     request: Request,
     task_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user)
 ) -> HTMLResponse:
     """
@@ -453,21 +626,21 @@ async def edit_task_page(
     Args:
         request (Request): Объект запроса.
         task_id (int): Идентификатор задачи.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
         current_user (Optional[models.User]): Текущий пользователь.
 
     Returns:
         HTMLResponse: HTML-страница для редактирования задачи.
     """
-    task: Optional[models.Task] = crud.get_task(db, task_id=task_id)
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id)
+    task: Optional[models.Task] = None
+    if current_user is not None:
+        task = await crud.get_user_task(db, task_id=task_id, user_id=current_user.id)
     if task is None:
         raise HTTPException(status_code=404, detail="Задача не найдена")
     return templates.TemplateResponse("edit_task.html", {
         "request": request,
         "task": task,
         "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks,
         "errors": {}
     })
 
@@ -477,7 +650,7 @@ async def edit_task(
     request: Request,
     task_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Обрабатывает запрос на редактирование задачи.
@@ -488,7 +661,7 @@ async def edit_task(
         request (Request): Объект запроса.
         task_id (int): Идентификатор задачи.
         current_user (models.User): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: Перенаправление на страницу задач.
@@ -507,11 +680,10 @@ async def edit_task(
     if len(form.get("description")) > 200:
         errors["description"] = "Описание должно быть не длиннее 200 символов"
 
-    existing_task: Optional[models.Task] = crud.get_task(db, task_id)
-    if existing_task is None or existing_task.owner_id != current_user.id:
-        errors["permission"] = "У вас нет разрешения на редактирование этой задачи"
-
     if errors:
+        existing_task: Optional[models.Task] = await crud.get_user_task(db, task_id=task_id, user_id=current_user.id)
+        if existing_task is None:
+            errors["permission"] = "У вас нет разрешения на редактирование этой задачи"
         return templates.TemplateResponse("edit_task.html", {
             "request": request,
             "task": existing_task,
@@ -531,7 +703,15 @@ async def edit_task(
         priority=form.get("priority"),
         deadline=deadline
     )
-    crud.update_task(db, task_id, task)
+    # Принадлежность задачи проверяется в самом запросе UPDATE
+    if await crud.update_task(db, task_id, task, user_id=current_user.id) is None:
+        errors["permission"] = "У вас нет разрешения на редактирование этой задачи"
+        return templates.TemplateResponse("edit_task.html", {
+            "request": request,
+            "task": None,
+            "current_user": current_user,
+            "errors": errors
+        })
     return RedirectResponse(url="/tasks", status_code=status.HTTP_302_FOUND)
 
 
@@ -540,7 +720,7 @@ async def delete_task(
     request: Request,
     task_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Обрабатывает запрос на удаление задачи.
@@ -551,21 +731,17 @@ async def delete_task(
         request (Request): Объект запроса.
         task_id (int): Идентификатор задачи.
         current_user (models.User): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
         HTMLResponse: Перенаправление на страницу задач.
     """
     errors: Dict[str, str] = {}
 
-    existing_task: Optional[models.Task] = crud.get_task(db, task_id)
-    if existing_task is None or existing_task.owner_id != current_user.id:
+    # Принадлежность задачи проверяется в самом запросе DELETE
+    if not await crud.delete_task(db, task_id, user_id=current_user.id):
         errors["permission"] = "У вас нет разрешения на удаление этой задачи"
-
-    if errors:
-        return templates.TemplateResponse("task.html", {"request": request, "task": existing_task, "current_user": current_user, "errors": errors})
-
-    crud.delete_task(db, task_id)
+        return templates.TemplateResponse("task.html", {"request": request, "task": None, "current_user": current_user, "errors": errors})
     return RedirectResponse(url="/tasks", status_code=status.HTTP_302_FOUND)
 
 
@@ -574,19 +750,23 @@ async def task_page(
     request: Request,
     task_id: int,
     current_user: Optional[models.User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> HTMLResponse:
     """
     Отображает страницу с информацией о задаче.
 
+    Страница содержит ETag и Last-Modified версии задачи; если задача не менялась,
+    возвращается 304 без рендеринга шаблона. Отрендеренная страница сохраняется в кэше
+    страниц (`page_cache`), и повторный просмотр не обращается к базе данных.
+
     Args:
         request (Request): Объект запроса.
         task_id (int): Идентификатор задачи.
         current_user (Optional[models.User]): Текущий пользователь.
-        db (Session): Сессия базы данных.
+        db (AsyncSession): Сессия базы данных.
 
     Returns:
-        HTMLResponse: HTML-страница с информацией о задаче.
+        HTMLResponse: HTML-страница с информацией о задаче или пустой ответ 304.
     """
     errors: Dict[str, str] = {}
 
@@ -598,25 +778,97 @@ async def task_page(
             "errors": errors
         })
 
-    task: Optional[models.Task] = crud.get_task(db, task_id=task_id)
+    cached: Optional[Response] = _cached_page(request, current_user.id)
+    if cached is not None:
+        return cached
+    stamp: int = page_cache.stamp(current_user.id)
+
+    # Чужая задача не отличается от несуществующей: принадлежность проверяется в том же запросе
+    task: Optional[models.Task] = await crud.get_user_task(db, task_id=task_id, user_id=current_user.id)
     if task is None:
         errors["task"] = "Задача не найдена"
-    elif task.owner_id != current_user.id:
-        errors["permission"] = "У вас нет разрешения на просмотр этой задачи"
-
-    near_deadline_tasks: List[Dict[str, str]] = crud.get_tasks_with_near_deadline(db, user_id=current_user.id) if current_user else []
 
     if errors:
         return templates.TemplateResponse("task.html", {
             "request": request,
+            "task": None,
             "current_user": current_user,
-            "near_deadline_tasks": near_deadline_tasks,
             "errors": errors
         })
 
-    return templates.TemplateResponse("task.html", {
+    # Страница задачи меняется только вместе с версией задачи, поэтому при совпадении ETag шаблон не рендерится
+    etag: str = make_etag("task", current_user.id, task.id, task.version)
+    if is_not_modified(request, etag, task.updated_at):
+        return not_modified_response(etag, task.updated_at)
+
+    response = templates.TemplateResponse("task.html", {
         "request": request,
         "task": task,
-        "current_user": current_user,
-        "near_deadline_tasks": near_deadline_tasks
-    })
+        "current_user": current_user
+    }, headers=cache_headers(etag, task.updated_at))
+    return _cache_page(request, current_user.id, stamp, response, etag, task.updated_at)
+
+
+def _format_deadline_event(tasks: List[Dict[str, Any]]) -> str:
+    """
+    Формирует событие Server-Sent Events со списком задач.
+
+    Args:
+        tasks (List[Dict[str, Any]]): Задачи в виде словарей.
+
+    Returns:
+        str: Событие `deadline` в формате text/event-stream.
+    """
+    return f"event: deadline\ndata: {json.dumps(tasks, ensure_ascii=False)}\n\n"
+
+
+@app.get("/events/deadlines")
+async def deadline_events(
+    request: Request,
+    current_user: Optional[models.User] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Поток Server-Sent Events с задачами, срок выполнения которых истекает в течение суток.
+
+    Первое событие содержит текущий список задач пользователя, следующие отправляет
+    планировщик `deadline_scheduler`, когда задача входит в последние сутки до срока.
+    Во время простоя отправляются комментарии keepalive, чтобы прокси не закрывали соединение.
+
+    Args:
+        request (Request): Объект запроса.
+        current_user (Optional[models.User]): Текущий пользователь.
+        db (AsyncSession): Сессия базы данных.
+
+    Returns:
+        StreamingResponse: Поток событий в формате text/event-stream.
+
+    Raises:
+        HTTPException: Если пользователь не авторизован.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    user_id: int = current_user.id
+    # Сессия базы данных закрывается до начала отправки потока, поэтому начальный список загружается заранее
+    initial_tasks: List[Dict[str, Any]] = await crud.get_tasks_with_near_deadline(db, user_id=user_id)
+
+    async def event_stream() -> AsyncIterator[str]:
+        queue = deadline_notifier.subscribe(user_id)
+        try:
+            yield _format_deadline_event(initial_tasks)
+            while not await request.is_disconnected():
+                try:
+                    tasks = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _format_deadline_event(tasks)
+        finally:
+            deadline_notifier.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
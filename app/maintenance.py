@@ -0,0 +1,110 @@
+"""
+Модуль для фоновых задач обслуживания базы данных.
+
+Этот модуль предоставляет очистку истекших сессий пачками и загрузку задач для планировщика сроков.
+Очистка запускается периодически в жизненном цикле приложения или вручную из командной строки:
+
+    python -m app.maintenance --batch-size 1000
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import logging
+from typing import Any, Dict, List, Tuple
+
+from . import crud
+from .configs.configs import SESSION_REAPER_BATCH_SIZE
+from .database import AsyncSessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+
+async def reap_expired_sessions(batch_size: int = SESSION_REAPER_BATCH_SIZE) -> int:
+    """
+    Удаляет все истекшие сессии пачками по `batch_size` строк.
+
+    Каждая пачка удаляется в отдельной транзакции, а между пачками управление
+    возвращается циклу событий.
+
+    Args:
+        batch_size (int): Размер пачки. По умолчанию `SESSION_REAPER_BATCH_SIZE`.
+
+    Returns:
+        int: Общее количество удаленных сессий.
+    """
+    total = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            deleted = await crud.delete_expired_sessions(db, batch_size)
+            total += deleted
+            if deleted < batch_size:
+                break
+            await asyncio.sleep(0)
+
+    logger.info("Session reaper removed %d expired sessions", total)
+    return total
+
+
+async def run_session_reaper(interval: float, batch_size: int = SESSION_REAPER_BATCH_SIZE) -> None:
+    """
+    Периодически очищает истекшие сессии, пока задача не будет отменена.
+
+    Ошибки отдельного запуска логируются и не останавливают цикл.
+
+    Args:
+        interval (float): Интервал между запусками в секундах.
+        batch_size (int): Размер пачки. По умолчанию `SESSION_REAPER_BATCH_SIZE`.
+    """
+    while True:
+        try:
+            await reap_expired_sessions(batch_size)
+        except Exception:
+            logger.exception("Session reaper run failed")
+        await asyncio.sleep(interval)
+
+
+async def load_upcoming_deadlines() -> List[Tuple[int, int, datetime, Dict[str, Any]]]:
+    """
+    Загружает задачи с будущим сроком для планировщика сроков `deadline_scheduler`.
+
+    Returns:
+        List[Tuple[int, int, datetime, Dict[str, Any]]]: Кортежи
+        (идентификатор задачи, идентификатор владельца, срок, задача в виде словаря).
+    """
+    async with AsyncSessionLocal() as db:
+        tasks = await crud.get_tasks_with_upcoming_deadline(db)
+    return [(task.id, task.owner_id, task.deadline, crud.task_to_dict(task)) for task in tasks]
+
+
+async def _run_once(batch_size: int) -> int:
+    """
+    Выполняет одну очистку и закрывает пул соединений.
+
+    Args:
+        batch_size (int): Размер пачки.
+
+    Returns:
+        int: Количество удаленных сессий.
+    """
+    try:
+        return await reap_expired_sessions(batch_size)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """
+    Точка входа командной строки: однократно удаляет истекшие сессии и печатает их количество.
+    """
+    parser = argparse.ArgumentParser(description="Удаление истекших сессий")
+    parser.add_argument("--batch-size", type=int, default=SESSION_REAPER_BATCH_SIZE, help="Размер пачки удаления")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    deleted = asyncio.run(_run_once(args.batch_size))
+    print(f"Removed {deleted} expired sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,20 +5,41 @@
 Каждая модель описывает таблицу в базе данных и её связи с другими таблицами.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import Integer, String, DateTime, Enum, ForeignKey
+from sqlalchemy import DDL, Integer, String, DateTime, Enum, ForeignKey, Grouping, Index, case, event, literal_column
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import relationship, Mapped, mapped_column, DeclarativeBase
 
 
-class Base(DeclarativeBase):
+# Допустимые статусы задач в порядке колонок списка задач
+TASK_STATUSES: Tuple[str, ...] = ("новая", "в процессе", "завершена")
+
+# Допустимые приоритеты задач
+TASK_PRIORITIES: Tuple[str, ...] = ("низкий", "средний", "высокий")
+
+
+class Base(AsyncAttrs, DeclarativeBase):
     """
     Базовый класс для всех моделей ORM.
 
     Этот класс наследуется от `DeclarativeBase` и используется для объявления
-    таблиц и схемы базы данных.
+    таблиц и схемы базы данных. Примесь `AsyncAttrs` позволяет загружать связи
+    в асинхронной сессии через `awaitable_attrs`.
+
+    `eager_defaults` включен для всех моделей: значения по умолчанию, сгенерированные
+    базой данных, возвращаются тем же INSERT/UPDATE (`RETURNING`), поэтому после фиксации
+    объекты не нужно перечитывать через `refresh`.
     """
-    pass
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Расширение pg_trgm нужно для триграммного индекса по заголовкам задач
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
 
 
 class User(Base):
@@ -29,6 +50,8 @@ class User(Base):
         id (int): Уникальный идентификатор пользователя (первичный ключ).
         username (str): Уникальное имя пользователя.
         hashed_password (str): Хэшированный пароль пользователя.
+        tasks_version (int): Версия списка задач пользователя, увеличивается при каждом изменении задач.
+        tasks_updated_at (Optional[DateTime]): Время последнего изменения задач пользователя (UTC).
         tasks (List[Task]): Список задач, принадлежащих пользователю.
         sessions (List[Session]): Список сессий, связанных с пользователем.
     """
@@ -43,6 +66,12 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String)
     """Хэшированный пароль пользователя."""
 
+    tasks_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    """Версия списка задач пользователя, увеличивается при каждом изменении задач."""
+
+    tasks_updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime, nullable=True)
+    """Время последнего изменения задач пользователя (UTC)."""
+
     tasks: Mapped[List["Task"]] = relationship("Task", back_populates="owner")
     """Список задач, принадлежащих пользователю."""
 
@@ -61,6 +90,9 @@ class Task(Base):
         status (str): Статус задачи (один из: "новая", "в процессе", "завершена").
         priority (str): Приоритет задачи (один из: "низкий", "средний", "высокий").
         deadline (Optional[DateTime]): Срок выполнения задачи (может быть None).
+        version (int): Версия задачи, увеличивается при каждом изменении.
+        updated_at (Optional[DateTime]): Время последнего изменения задачи (UTC).
+        change_seq (int): Версия списка задач пользователя (`User.tasks_version`), в которой задача изменена последний раз.
         owner_id (int): Идентификатор пользователя, которому принадлежит задача.
         owner (User): Пользователь, которому принадлежит задача.
     """
@@ -72,17 +104,17 @@ class Task(Base):
     title: Mapped[str] = mapped_column(String, index=True)
     """Заголовок задачи."""
 
-    description: Mapped[str] = mapped_column(String, index=True)
+    description: Mapped[str] = mapped_column(String)
     """Описание задачи."""
 
     status: Mapped[str] = mapped_column(
-        Enum("новая", "в процессе", "завершена", name="status_enum"),
+        Enum(*TASK_STATUSES, name="status_enum"),
         default="новая"
     )
     """Статус задачи (один из: "новая", "в процессе", "завершена")."""
 
     priority: Mapped[str] = mapped_column(
-        Enum("низкий", "средний", "высокий", name="priority_enum"),
+        Enum(*TASK_PRIORITIES, name="priority_enum"),
         default="средний"
     )
     """Приоритет задачи (один из: "низкий", "средний", "высокий")."""
@@ -90,12 +122,90 @@ class Task(Base):
     deadline: Mapped[Optional[DateTime]] = mapped_column(DateTime, nullable=True)
     """Срок выполнения задачи (может быть None)."""
 
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    """Версия задачи, увеличивается при каждом изменении."""
+
+    updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime, nullable=True)
+    """Время последнего изменения задачи (UTC)."""
+
+    change_seq: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    """Версия списка задач пользователя (`User.tasks_version`), в которой задача изменена последний раз."""
+
     owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     """Идентификатор пользователя, которому принадлежит задача."""
 
     owner: Mapped["User"] = relationship("User", back_populates="tasks")
     """Пользователь, которому принадлежит задача."""
 
+    __table_args__ = (
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        Index("ix_tasks_owner_id_deadline", "owner_id", "deadline"),
+        Index("ix_tasks_deadline", "deadline"),
+        Index("ix_tasks_owner_id_change_seq", "owner_id", "change_seq"),
+        Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+    """
+    Индексы задач:
+    - `ix_tasks_owner_id_id`: список задач пользователя с курсорной пагинацией (`crud.get_tasks`)
+      и поиск по внешнему ключу `owner_id`.
+    - `ix_tasks_owner_id_deadline`: задачи с приближающимся сроком (`crud.get_tasks_with_near_deadline`).
+    - `ix_tasks_deadline`: задачи всех пользователей с будущим сроком (загрузка планировщика сроков).
+    - `ix_tasks_owner_id_change_seq`: задачи, измененные после версии списка (`crud.get_task_changes`).
+    - `ix_tasks_owner_id_status_priority_rank`: выборка задач пользователя по статусу и колонка задач
+      с одним статусом, упорядоченная по приоритету (`crud.get_tasks_by_status`, объявлен после класса,
+      так как использует выражение `TASK_PRIORITY_RANK`).
+    - `ix_tasks_title_trgm`: триграммный GIN-индекс по заголовку для поиска через pg_trgm (только PostgreSQL).
+    """
+
+
+# Ранг приоритета для сортировки задач в SQL: сначала высокий приоритет.
+# Значения подставляются в SQL литералами, чтобы запрос совпадал с выражением индекса.
+TASK_PRIORITY_RANK = case(
+    (Task.priority == literal_column("'высокий'"), literal_column("1")),
+    (Task.priority == literal_column("'средний'"), literal_column("2")),
+    else_=literal_column("3")
+)
+
+# Выражение в индексе должно быть в скобках, иначе PostgreSQL не разберет `CREATE INDEX`
+Index("ix_tasks_owner_id_status_priority_rank", Task.owner_id, Task.status, Grouping(TASK_PRIORITY_RANK), Task.id)
+
+
+class TaskTombstone(Base):
+    """
+    Модель для представления записей об удаленных задачах.
+
+    Используется для синхронизации изменений: клиент узнает об удалении задачи,
+    запросив изменения после известной ему версии списка задач.
+
+    Атрибуты:
+        task_id (int): Идентификатор удаленной задачи (первичный ключ).
+        owner_id (int): Идентификатор пользователя, которому принадлежала задача.
+        change_seq (int): Версия списка задач пользователя, в которой задача удалена.
+        deleted_at (DateTime): Время удаления задачи (UTC).
+    """
+    __tablename__ = "task_tombstones"
+
+    task_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    """Идентификатор удаленной задачи (первичный ключ)."""
+
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    """Идентификатор пользователя, которому принадлежала задача."""
+
+    change_seq: Mapped[int] = mapped_column(Integer)
+    """Версия списка задач пользователя, в которой задача удалена."""
+
+    deleted_at: Mapped[DateTime] = mapped_column(DateTime)
+    """Время удаления задачи (UTC)."""
+
+    __table_args__ = (
+        Index("ix_task_tombstones_owner_id_change_seq", "owner_id", "change_seq"),
+    )
+
 
 class Session(Base):
     """
@@ -119,8 +229,8 @@ class Session(Base):
     session_token: Mapped[str] = mapped_column(String, unique=True, index=True)
     """Уникальный токен сессии."""
 
-    expires_at: Mapped[DateTime] = mapped_column(DateTime)
-    """Время истечения сессии."""
+    expires_at: Mapped[DateTime] = mapped_column(DateTime, index=True)
+    """Время истечения сессии (индекс используется при очистке истекших сессий)."""
 
     user: Mapped["User"] = relationship("User", back_populates="sessions")
     """Пользователь, связанный с сессией."""
@@ -0,0 +1,76 @@
+"""
+Модуль для рассылки уведомлений о приближающихся сроках задач.
+
+Этот модуль предоставляет `DeadlineNotifier` — реестр подписчиков (открытых вкладок браузера),
+которым планировщик сроков (`app.scheduler`) отправляет задачи, вошедшие в последние сутки
+до срока. Вкладки получают их через Server-Sent Events.
+
+Подписчики хранятся в памяти процесса, поэтому каждый воркер уведомляет только
+подключенные к нему вкладки.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Set
+
+
+class DeadlineNotifier:
+    """
+    Реестр подписчиков на уведомления о сроках.
+
+    Атрибуты:
+        queue_size (int): Максимальное количество неотправленных событий на одного подписчика.
+    """
+
+    def __init__(self, queue_size: int = 16) -> None:
+        self.queue_size: int = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """
+        Регистрирует подписчика пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            asyncio.Queue: Очередь, в которую будут приходить списки задач.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        """
+        Удаляет подписчика пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            queue (asyncio.Queue): Очередь, полученная от `subscribe`.
+        """
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def publish(self, user_id: int, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Отправляет список задач всем подписчикам пользователя.
+
+        Если очередь подписчика переполнена (вкладка не читает события), событие для неё пропускается.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            tasks (List[Dict[str, Any]]): Задачи в виде словарей.
+        """
+        for queue in self._subscribers.get(user_id, ()):
+            if not queue.full():
+                queue.put_nowait(tasks)
+
+
+deadline_notifier: DeadlineNotifier = DeadlineNotifier()
+"""
+Глобальный реестр подписчиков на уведомления о сроках.
+"""
@@ -0,0 +1,223 @@
+"""
+Модуль планировщика сроков выполнения задач.
+
+Этот модуль предоставляет `DeadlineScheduler` — очередь с приоритетом (min-heap) по времени,
+когда задача входит в последние сутки до срока. Очередь загружается из базы данных один раз
+при запуске, а затем обновляется функциями `crud` при создании, изменении и удалении задач,
+поэтому проверка сроков не требует запросов к таблице задач.
+
+Когда задача входит в суточное окно, планировщик отправляет уведомление подписчикам
+пользователя (`deadline_notifier`) и сбрасывает кэш задач с приближающимся сроком.
+
+Очередь хранится в памяти процесса: изменения, сделанные другим воркером, попадают в неё
+при периодической повторной загрузке (`DEADLINE_RESYNC_INTERVAL`).
+"""
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+import heapq
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .cache import near_deadline_cache
+from .notifications import deadline_notifier
+
+logger = logging.getLogger(__name__)
+
+# Типы событий очереди: вход задачи в окно уведомления и истечение срока
+_ENTER: int = 0
+_EXPIRE: int = 1
+
+
+class DeadlineScheduler:
+    """
+    Очередь сроков задач всех пользователей.
+
+    Каждый элемент очереди — кортеж (время события, тип события, идентификатор задачи, срок).
+    Устаревшие элементы (задача удалена или срок изменен) не удаляются из кучи сразу,
+    а пропускаются при извлечении; когда их становится больше, чем актуальных, куча перестраивается.
+
+    Атрибуты:
+        window (timedelta): За сколько до срока задача считается приближающейся.
+    """
+
+    def __init__(self, window: timedelta = timedelta(days=1)) -> None:
+        self.window: timedelta = window
+        self._heap: List[Tuple[datetime, int, int, datetime]] = []
+        self._deadlines: Dict[int, datetime] = {}
+        self._tasks: Dict[int, Dict[str, Any]] = {}
+        self._entered: Set[int] = set()
+        self._wakeup: asyncio.Event = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, task_id: int, owner_id: int, deadline: Optional[datetime], task: Dict[str, Any]) -> None:
+        """
+        Добавляет задачу в очередь или обновляет её.
+
+        Если срок не изменился, обновляются только данные задачи, и повторное уведомление не отправляется.
+
+        Args:
+            task_id (int): Идентификатор задачи.
+            owner_id (int): Идентификатор владельца задачи.
+            deadline (Optional[datetime]): Срок выполнения (UTC без часового пояса) или None.
+            task (Dict[str, Any]): Задача в виде словаря, которая отправляется в уведомлении.
+        """
+        if deadline is None or deadline <= _utcnow():
+            self.cancel(task_id)
+            return
+
+        self._tasks[task_id] = {**task, "owner_id": owner_id}
+        if self._deadlines.get(task_id) == deadline:
+            return
+
+        self._deadlines[task_id] = deadline
+        self._entered.discard(task_id)
+        self._push(deadline - self.window, _ENTER, task_id, deadline)
+        self._compact()
+
+    def cancel(self, task_id: int) -> None:
+        """
+        Удаляет задачу из очереди. Отсутствующие задачи игнорируются.
+
+        Args:
+            task_id (int): Идентификатор задачи.
+        """
+        self._deadlines.pop(task_id, None)
+        self._tasks.pop(task_id, None)
+        self._entered.discard(task_id)
+
+    def load(self, tasks: Iterable[Tuple[int, int, datetime, Dict[str, Any]]]) -> None:
+        """
+        Синхронизирует очередь с полным списком задач с будущим сроком.
+
+        Задачи, которых нет в списке, удаляются из очереди; уже отправленные уведомления
+        о задачах с неизменным сроком не повторяются.
+
+        Args:
+            tasks (Iterable[Tuple[int, int, datetime, Dict[str, Any]]]): Кортежи
+                (идентификатор задачи, идентификатор владельца, срок, задача в виде словаря).
+        """
+        seen: Set[int] = set()
+        for task_id, owner_id, deadline, task in tasks:
+            seen.add(task_id)
+            self.schedule(task_id, owner_id, deadline, task)
+        for task_id in [task_id for task_id in self._deadlines if task_id not in seen]:
+            self.cancel(task_id)
+        self._compact(force=True)
+
+    def fire_due(self, now: datetime) -> int:
+        """
+        Обрабатывает все события очереди, время которых наступило.
+
+        Args:
+            now (datetime): Текущее время (UTC без часового пояса).
+
+        Returns:
+            int: Количество задач, вошедших в окно уведомления.
+        """
+        entered: Dict[int, List[Dict[str, Any]]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, kind, task_id, deadline = heapq.heappop(self._heap)
+            if self._deadlines.get(task_id) != deadline:
+                continue
+            if kind == _EXPIRE or deadline <= now:
+                self.cancel(task_id)
+            elif task_id not in self._entered:
+                self._entered.add(task_id)
+                task = self._tasks[task_id]
+                entered.setdefault(task["owner_id"], []).append(task)
+                self._push(deadline, _EXPIRE, task_id, deadline)
+
+        for owner_id, tasks in entered.items():
+            near_deadline_cache.pop(owner_id)
+            deadline_notifier.publish(owner_id, tasks)
+        self._compact()
+        return sum(len(tasks) for tasks in entered.values())
+
+    def next_event_in(self, now: datetime) -> Optional[float]:
+        """
+        Возвращает количество секунд до ближайшего события очереди.
+
+        Args:
+            now (datetime): Текущее время (UTC без часового пояса).
+
+        Returns:
+            Optional[float]: Секунды до события или None, если очередь пуста.
+        """
+        if not self._heap:
+            return None
+        return max(0.0, (self._heap[0][0] - now).total_seconds())
+
+    async def run(
+        self,
+        load: Callable[[], Awaitable[Iterable[Tuple[int, int, datetime, Dict[str, Any]]]]],
+        resync_interval: float
+    ) -> None:
+        """
+        Загружает очередь и обрабатывает её события, пока задача не будет отменена.
+
+        Между событиями планировщик спит до ближайшего срока и просыпается раньше,
+        если `schedule` добавил в очередь новую задачу.
+
+        Args:
+            load (Callable): Функция, которая возвращает задачи с будущим сроком (см. `load`).
+            resync_interval (float): Интервал повторной загрузки в секундах. 0 — загрузить один раз.
+        """
+        next_resync = 0.0
+        while True:
+            if time.monotonic() >= next_resync:
+                try:
+                    self.load(await load())
+                    logger.info("Deadline scheduler loaded %d tasks", len(self))
+                except Exception:
+                    logger.exception("Deadline scheduler load failed")
+                next_resync = time.monotonic() + resync_interval if resync_interval > 0 else float("inf")
+
+            self._wakeup.clear()
+            now = _utcnow()
+            self.fire_due(now)
+
+            timeout = next_resync - time.monotonic()
+            next_event_in = self.next_event_in(now)
+            if next_event_in is not None:
+                timeout = min(timeout, next_event_in)
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=None if timeout == float("inf") else timeout)
+
+    def _push(self, at: datetime, kind: int, task_id: int, deadline: datetime) -> None:
+        """
+        Добавляет событие в кучу и будит цикл `run`, если событие стало ближайшим.
+        """
+        heapq.heappush(self._heap, (at, kind, task_id, deadline))
+        if self._heap[0][2] == task_id:
+            self._wakeup.set()
+
+    def _compact(self, force: bool = False) -> None:
+        """
+        Перестраивает кучу без устаревших элементов, если их больше, чем актуальных.
+        """
+        if not force and len(self._heap) <= 2 * len(self._deadlines) + 64:
+            return
+        self._heap = [
+            (deadline, _EXPIRE, task_id, deadline) if task_id in self._entered
+            else (deadline - self.window, _ENTER, task_id, deadline)
+            for task_id, deadline in self._deadlines.items()
+        ]
+        heapq.heapify(self._heap)
+
+
+def _utcnow() -> datetime:
+    """
+    Возвращает текущее время в UTC без информации о часовом поясе, как оно хранится в столбце `deadline`.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+deadline_scheduler: DeadlineScheduler = DeadlineScheduler()
+"""
+Глобальный планировщик сроков. Обновляется функциями `crud.create_task`, `crud.update_task` и `crud.delete_task`.
+"""
@@ -84,6 +84,151 @@ class Task(TaskBase):
         from_attributes = True
 
 
+class TaskPage(BaseModel):
+    """
+    Модель для представления страницы списка задач.
+
+    Атрибуты:
+        items (List[Task]): Задачи текущей страницы.
+        next_cursor (Optional[str]): Непрозрачный токен следующей страницы (None, если страница последняя).
+    """
+    items: List[Task]
+    """Задачи текущей страницы."""
+
+    next_cursor: Optional[str] = None
+    """Непрозрачный токен следующей страницы (None, если страница последняя)."""
+
+
+class TaskChanges(BaseModel):
+    """
+    Модель для представления изменений задач после известной клиенту версии списка.
+
+    Клиент применяет сначала `upserts`, затем `deletes`, и передает `version` в следующем запросе.
+
+    Атрибуты:
+        version (int): Текущая версия списка задач пользователя.
+        upserts (List[Task]): Созданные или измененные задачи.
+        deletes (List[int]): Идентификаторы удаленных задач.
+    """
+    version: int
+    """Текущая версия списка задач пользователя."""
+
+    upserts: List[Task]
+    """Созданные или измененные задачи."""
+
+    deletes: List[int]
+    """Идентификаторы удаленных задач."""
+
+
+class TaskUpdateItem(TaskCreate):
+    """
+    Модель для обновления задачи в пакетном запросе.
+
+    Атрибуты:
+        id (int): Идентификатор обновляемой задачи.
+    """
+    id: int
+    """Идентификатор обновляемой задачи."""
+
+
+class TaskBatch(BaseModel):
+    """
+    Модель пакетного запроса на изменение задач.
+
+    Операции выполняются в одной транзакции в порядке: создание, обновление, удаление.
+
+    Атрибуты:
+        create (List[TaskCreate]): Задачи для создания.
+        update (List[TaskUpdateItem]): Задачи для обновления.
+        delete (List[int]): Идентификаторы задач для удаления.
+    """
+    create: List[TaskCreate] = []
+    """Задачи для создания."""
+
+    update: List[TaskUpdateItem] = []
+    """Задачи для обновления."""
+
+    delete: List[int] = []
+    """Идентификаторы задач для удаления."""
+
+
+class TaskBatchItemResult(BaseModel):
+    """
+    Модель результата одной операции пакетного запроса.
+
+    Атрибуты:
+        op (str): Операция ("create", "update" или "delete").
+        index (int): Позиция элемента в списке операции запроса.
+        id (Optional[int]): Идентификатор задачи.
+        status (str): "ok", "forbidden" (задача не найдена или не принадлежит пользователю)
+            или "invalid" (недопустимый статус или приоритет).
+        error (Optional[str]): Описание ошибки для статуса "invalid".
+        task (Optional[Task]): Созданная или обновленная задача.
+    """
+    op: str
+    """Операция ("create", "update" или "delete")."""
+
+    index: int
+    """Позиция элемента в списке операции запроса."""
+
+    id: Optional[int] = None
+    """Идентификатор задачи."""
+
+    status: str
+    """"ok", "forbidden" (задача не найдена или не принадлежит пользователю) или "invalid"."""
+
+    error: Optional[str] = None
+    """Описание ошибки для статуса "invalid"."""
+
+    task: Optional[Task] = None
+    """Созданная или обновленная задача."""
+
+
+class TaskBatchResult(BaseModel):
+    """
+    Модель ответа на пакетный запрос.
+
+    Атрибуты:
+        results (List[TaskBatchItemResult]): Результаты операций в порядке запроса.
+    """
+    results: List[TaskBatchItemResult]
+    """Результаты операций в порядке запроса."""
+
+
+class TaskImportError(BaseModel):
+    """
+    Модель ошибки строки файла импорта.
+
+    Атрибуты:
+        row (int): Номер строки файла (начиная с 1).
+        error (str): Описание ошибки.
+    """
+    row: int
+    """Номер строки файла (начиная с 1)."""
+
+    error: str
+    """Описание ошибки."""
+
+
+class TaskImportResult(BaseModel):
+    """
+    Модель ответа на импорт задач.
+
+    Атрибуты:
+        imported (int): Количество загруженных задач.
+        failed (int): Количество строк, которые не удалось загрузить.
+        errors (List[TaskImportError]): Первые ошибки строк (не более `IMPORT_MAX_ERRORS`).
+    """
+    imported: int
+    """Количество загруженных задач."""
+
+    failed: int
+    """Количество строк, которые не удалось загрузить."""
+
+    errors: List[TaskImportError]
+    """Первые ошибки строк (не более `IMPORT_MAX_ERRORS`)."""
+
+
 class UserBase(BaseModel):
     """
     Базовая модель для пользователя.
@@ -0,0 +1,267 @@
+"""
+Модуль для индексированного нечеткого поиска задач по заголовку.
+
+Этот модуль предоставляет BK-дерево (дерево Буркхарда-Келлера) по расстоянию Левенштейна
+и реестр таких деревьев для каждого пользователя. Индекс строится лениво при первом поиске
+и поддерживается в актуальном состоянии функциями создания, обновления и удаления задач в `crud`.
+
+Индекс хранится в памяти процесса, поэтому при запуске нескольких воркеров каждый из них
+поддерживает собственную копию. Каждый индекс помечен версией списка задач пользователя
+(`users.tasks_version`), по которой он построен: если задачи изменил другой воркер,
+версия в базе данных не совпадет, и индекс будет построен заново.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from Levenshtein import distance as levenshtein_distance
+
+from .configs.configs import SEARCH_INDEX_MAX_USERS
+
+
+class _BKNode:
+    """
+    Узел BK-дерева.
+
+    Атрибуты:
+        key (str): Заголовок задачи в нижнем регистре.
+        task_ids (Set[int]): Идентификаторы задач с таким заголовком.
+        children (Dict[int, _BKNode]): Дочерние узлы, сгруппированные по расстоянию до ключа.
+    """
+    __slots__ = ("key", "task_ids", "children")
+
+    def __init__(self, key: str) -> None:
+        self.key: str = key
+        self.task_ids: Set[int] = set()
+        self.children: Dict[int, "_BKNode"] = {}
+
+
+class TitleIndex:
+    """
+    BK-дерево заголовков задач одного пользователя.
+
+    Ключом узла является заголовок в нижнем регистре, поэтому задачи с одинаковыми заголовками
+    хранятся в одном узле. Удаление помечает узел пустым, а дерево перестраивается,
+    когда пустых узлов становится больше, чем заполненных.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[_BKNode] = None
+        self._nodes: Dict[str, _BKNode] = {}
+        self._keys: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, task_id: int, title: str) -> None:
+        """
+        Добавляет задачу в индекс или обновляет её заголовок.
+
+        Args:
+            task_id (int): Идентификатор задачи.
+            title (str): Заголовок задачи.
+        """
+        key = title.lower()
+        if self._keys.get(task_id) == key:
+            return
+        self.remove(task_id)
+        self._keys[task_id] = key
+        self._insert_key(key).task_ids.add(task_id)
+
+    def remove(self, task_id: int) -> None:
+        """
+        Удаляет задачу из индекса. Отсутствующие задачи игнорируются.
+
+        Args:
+            task_id (int): Идентификатор задачи.
+        """
+        key = self._keys.pop(task_id, None)
+        if key is None:
+            return
+        self._nodes[key].task_ids.discard(task_id)
+        if len(self._nodes) > 2 * len(self._keys) + 64:
+            self._rebuild()
+
+    def search(self, query: str, threshold: int) -> List[Tuple[int, int]]:
+        """
+        Ищет задачи, заголовок которых отличается от запроса не более чем на `threshold` правок.
+
+        Args:
+            query (str): Поисковый запрос.
+            threshold (int): Максимальное расстояние Левенштейна для совпадения.
+
+        Returns:
+            List[Tuple[int, int]]: Пары (идентификатор задачи, расстояние), упорядоченные по расстоянию.
+        """
+        if self._root is None:
+            return []
+
+        query = query.lower()
+        matches: List[Tuple[int, int]] = []
+        stack: List[_BKNode] = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = levenshtein_distance(query, node.key)
+            if distance <= threshold:
+                matches.extend((task_id, distance) for task_id in node.task_ids)
+            for edge, child in node.children.items():
+                if distance - threshold <= edge <= distance + threshold:
+                    stack.append(child)
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def _insert_key(self, key: str) -> _BKNode:
+        """
+        Возвращает узел для ключа, создавая его при необходимости.
+
+        Args:
+            key (str): Заголовок задачи в нижнем регистре.
+
+        Returns:
+            _BKNode: Узел BK-дерева с этим ключом.
+        """
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+
+        node = _BKNode(key)
+        self._nodes[key] = node
+        if self._root is None:
+            self._root = node
+            return node
+
+        current = self._root
+        while True:
+            distance = levenshtein_distance(key, current.key)
+            child = current.children.get(distance)
+            if child is None:
+                current.children[distance] = node
+                return node
+            current = child
+
+    def _rebuild(self) -> None:
+        """
+        Перестраивает дерево, отбрасывая пустые узлы.
+        """
+        keys = self._keys
+        self._root = None
+        self._nodes = {}
+        self._keys = {}
+        for task_id, key in keys.items():
+            self._keys[task_id] = key
+            self._insert_key(key).task_ids.add(task_id)
+
+
+class SearchIndexRegistry:
+    """
+    Реестр индексов заголовков по пользователям.
+
+    Хранит индексы не более чем `max_users` пользователей и вытесняет
+    давно не использовавшиеся (LRU). Вместе с индексом хранится версия списка задач
+    пользователя, которой он соответствует.
+    """
+
+    def __init__(self, max_users: int) -> None:
+        self._max_users: int = max_users
+        self._indexes: "OrderedDict[int, Tuple[int, TitleIndex]]" = OrderedDict()
+
+    def get(self, user_id: int, version: int) -> Optional[TitleIndex]:
+        """
+        Возвращает индекс пользователя, если он построен для указанной версии списка задач.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (int): Текущая версия списка задач пользователя (`users.tasks_version`).
+
+        Returns:
+            Optional[TitleIndex]: Индекс пользователя или None, если индекса нет или он устарел.
+        """
+        item = self._indexes.get(user_id)
+        if item is None:
+            return None
+        if item[0] != version:
+            del self._indexes[user_id]
+            return None
+        self._indexes.move_to_end(user_id)
+        return item[1]
+
+    def build(self, user_id: int, version: int, rows: Iterable[Tuple[int, str]]) -> TitleIndex:
+        """
+        Строит индекс пользователя по парам (идентификатор задачи, заголовок).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (int): Версия списка задач, прочитанная до загрузки заголовков.
+            rows (Iterable[Tuple[int, str]]): Пары (идентификатор задачи, заголовок).
+
+        Returns:
+            TitleIndex: Построенный индекс.
+        """
+        index = TitleIndex()
+        for task_id, title in rows:
+            index.add(task_id, title)
+        self._indexes[user_id] = (version, index)
+        self._indexes.move_to_end(user_id)
+        while len(self._indexes) > self._max_users:
+            self._indexes.popitem(last=False)
+        return index
+
+    def _advance(self, user_id: int, version: int) -> Optional[TitleIndex]:
+        """
+        Возвращает индекс, к которому можно применить изменение версии `version`, и помечает его этой версией.
+
+        Изменение применимо, если индекс построен для предыдущей версии или уже для этой же
+        (несколько изменений одной транзакции). Иначе индекс пропустил изменения другого воркера
+        и сбрасывается.
+        """
+        item = self._indexes.get(user_id)
+        if item is None:
+            return None
+        if item[0] not in (version - 1, version):
+            del self._indexes[user_id]
+            return None
+        self._indexes[user_id] = (version, item[1])
+        return item[1]
+
+    def add(self, user_id: int, version: int, task_id: int, title: str) -> None:
+        """
+        Добавляет или обновляет задачу в индексе пользователя, если индекс построен.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (int): Версия списка задач, в которой задача изменена (`change_seq`).
+            task_id (int): Идентификатор задачи.
+            title (str): Заголовок задачи.
+        """
+        index = self._advance(user_id, version)
+        if index is not None:
+            index.add(task_id, title)
+
+    def remove(self, user_id: int, version: int, task_id: int) -> None:
+        """
+        Удаляет задачу из индекса пользователя, если индекс построен.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (int): Версия списка задач, в которой задача удалена (`change_seq`).
+            task_id (int): Идентификатор задачи.
+        """
+        index = self._advance(user_id, version)
+        if index is not None:
+            index.remove(task_id)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Сбрасывает индекс пользователя. Он будет построен заново при следующем поиске.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+        """
+        self._indexes.pop(user_id, None)
+
+
+title_index: SearchIndexRegistry = SearchIndexRegistry(max_users=SEARCH_INDEX_MAX_USERS)
+"""
+Глобальный реестр индексов заголовков задач.
+"""
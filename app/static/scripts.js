@@ -1,16 +1,22 @@
 document.addEventListener("DOMContentLoaded", function() {
     console.log("DOMContentLoaded event fired");
-    var nearDeadlineTasks = JSON.parse(document.getElementById("near-deadline-tasks").textContent);
-    console.log("Near deadline tasks:", nearDeadlineTasks);
-    
-    if (nearDeadlineTasks.length > 0) {
+    if (!document.getElementById("deadlineModal") || !window.EventSource) {
+        return;
+    }
+
+    // Сервер присылает задачи с приближающимся сроком через Server-Sent Events
+    var deadlineEvents = new EventSource("/events/deadlines");
+    deadlineEvents.addEventListener("deadline", function(event) {
+        var nearDeadlineTasks = JSON.parse(event.data);
+        console.log("Near deadline tasks:", nearDeadlineTasks);
+
         nearDeadlineTasks.forEach(function(task) {
             if (shouldShowModal(task.id)) {
                 console.log("Alerting about task:", task.title);
                 showDeadlineModal(task.title, task.deadline, task.id);
             }
         });
-    }
+    });
 });
 
 function showDeadlineModal(taskTitle, taskDeadline, taskId) {
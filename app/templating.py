@@ -0,0 +1,94 @@
+"""
+Модуль для настройки окружения шаблонов Jinja2.
+
+Этот модуль создает окружение Jinja2 с кэшем байт-кода на диске (`FileSystemBytecodeCache`)
+и предоставляет функцию предварительной компиляции всех шаблонов при запуске приложения,
+чтобы первые запросы нового воркера не тратили время на разбор и компиляцию шаблонов.
+
+Карточки задач в списке задач рендерятся функцией шаблона `task_card`, которая
+кэширует HTML карточки по идентификатору и версии задачи (`task_card_cache`).
+"""
+
+import logging
+import os
+from typing import Any
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, pass_environment
+from markupsafe import Markup
+
+from .cache import task_card_cache
+from .configs.configs import APP_ENV, TEMPLATE_BYTECODE_CACHE, TEMPLATE_BYTECODE_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def create_template_environment(directory: str) -> Environment:
+    """
+    Создает окружение Jinja2 для каталога шаблонов.
+
+    Скомпилированный байт-код шаблонов сохраняется в `TEMPLATE_BYTECODE_CACHE_DIR` и используется
+    воркерами повторно, если файл шаблона не изменился. В режиме "production" (`APP_ENV`)
+    проверка изменения файлов шаблонов при каждом запросе отключена.
+
+    Args:
+        directory (str): Каталог шаблонов.
+
+    Returns:
+        Environment: Окружение Jinja2.
+    """
+    bytecode_cache = None
+    if TEMPLATE_BYTECODE_CACHE:
+        if TEMPLATE_BYTECODE_CACHE_DIR:
+            os.makedirs(TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR or None)
+
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=APP_ENV != "production",
+        bytecode_cache=bytecode_cache
+    )
+    env.globals["task_card"] = task_card
+    return env
+
+
+@pass_environment
+def task_card(env: Environment, task: Any) -> Markup:
+    """
+    Возвращает HTML карточки задачи (шаблон `task_card.html`).
+
+    Карточка рендерится один раз для каждой версии задачи; пока версия не изменилась,
+    HTML берется из `task_card_cache`.
+
+    Args:
+        env (Environment): Окружение Jinja2 (передается шаблоном автоматически).
+        task (Any): Задача (`models.Task`).
+
+    Returns:
+        Markup: HTML карточки задачи.
+    """
+    cached = task_card_cache.get(task.id)
+    if cached is not None and cached[0] == task.version:
+        return Markup(cached[1])
+    html = env.get_template("task_card.html").render(task=task)
+    task_card_cache.set(task.id, (task.version, html))
+    return Markup(html)
+
+
+def precompile_templates(env: Environment) -> int:
+    """
+    Загружает и компилирует все шаблоны окружения.
+
+    Скомпилированные шаблоны остаются в кэше окружения, а их байт-код записывается в кэш байт-кода.
+
+    Args:
+        env (Environment): Окружение Jinja2.
+
+    Returns:
+        int: Количество скомпилированных шаблонов.
+    """
+    names = [name for name in env.list_templates() if name.endswith(".html")]
+    for name in names:
+        env.get_template(name)
+    logger.info("Precompiled %d templates", len(names))
+    return len(names)